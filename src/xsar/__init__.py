@@ -13,18 +13,47 @@ __all__ = [
     "get_test_file",
 ]
 
-from xsar.radarsat2_dataset import RadarSat2Dataset
-from xsar.sentinel1_dataset import Sentinel1Dataset
-from xsar.sentinel1_meta import Sentinel1Meta
-from xsar.rcm_meta import RcmMeta
-from xsar.radarsat2_meta import RadarSat2Meta
-from xsar.rcm_dataset import RcmDataset
-from xsar.base_dataset import BaseDataset
-from xsar.base_meta import BaseMeta
-from xsar.xsar import open_dataset,open_datatree,product_info
-from xsar.xsar import get_test_file
-
-import xsar
+import importlib
+
+# public objects are imported on first access (PEP 562), so importing a light submodule
+# like `xsar.xarray_backends` doesn't import all readers and their dependencies.
+_lazy_objects = {
+    "RadarSat2Dataset": "xsar.radarsat2_dataset",
+    "Sentinel1Dataset": "xsar.sentinel1_dataset",
+    "Sentinel1Meta": "xsar.sentinel1_meta",
+    "RcmMeta": "xsar.rcm_meta",
+    "RadarSat2Meta": "xsar.radarsat2_meta",
+    "RcmDataset": "xsar.rcm_dataset",
+    "BaseDataset": "xsar.base_dataset",
+    "BaseMeta": "xsar.base_meta",
+    "open_dataset": "xsar.xsar",
+    "open_datatree": "xsar.xsar",
+    "product_info": "xsar.xsar",
+    "get_test_file": "xsar.xsar",
+}
+
+
+def __getattr__(name):
+    if name in _lazy_objects:
+        value = getattr(importlib.import_module(_lazy_objects[name]), name)
+    else:
+        # submodules, like `xsar.utils`
+        try:
+            value = importlib.import_module("%s.%s" % (__name__, name))
+        except ModuleNotFoundError as e:
+            if e.name != "%s.%s" % (__name__, name):
+                raise
+            raise AttributeError(
+                "module %r has no attribute %r" % (__name__, name)
+            ) from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
 try:
     from importlib import metadata
 except ImportError: # for Python<3.8
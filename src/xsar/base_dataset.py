@@ -36,6 +36,32 @@ warnings.filterwarnings(
 np.errstate(invalid="ignore")
 
 
+def _increasing(coords):
+    """
+    `coords` in increasing order (reversed view if decreasing, ie from a reversed `isel`), for `_nearest`.
+    Raise ValueError if `coords` are not strictly monotonic, like `xarray.Dataset.sel(method='nearest')`.
+    """
+    if coords.size > 1 and coords[0] > coords[-1]:
+        coords = coords[::-1]
+    if np.any(np.diff(coords) <= 0):
+        raise ValueError("coords must be strictly monotonic")
+    return coords
+
+
+def _nearest(coords, values):
+    """
+    nearest `coords` for each of `values`, like `xarray.Dataset.sel(method='nearest')`.
+    `coords` must be strictly increasing (see `_increasing`).
+    """
+    values = np.asarray(values)
+    if coords.size == 1:
+        return np.full(values.shape, coords[0])
+    idx = np.clip(np.searchsorted(coords, values), 1, coords.size - 1)
+    left = coords[idx - 1]
+    right = coords[idx]
+    return np.where(values - left < right - values, left, right)
+
+
 class BaseDataset(ABC):
     """
     Abstract class that defines necessary common functions for the computation of different SAR dataset variables
@@ -52,6 +78,9 @@ class BaseDataset(ABC):
     resolution = None
     _da_tmpl = None
     _luts = None
+    _luts_sq = None
+    # variables skipped when `skip_variables` is not given
+    _default_skip_variables = []
     _map_var_lut = None
     _dtypes = {
         "latitude": "f4",
@@ -75,19 +104,20 @@ class BaseDataset(ABC):
     }
     _default_meta = asarray([], dtype="f8")
     geoloc_tree = None
+    _cache_bbox = None
 
     @property
     def len_line_m(self):
         """line length, in meters"""
-        _bbox_ll = list(zip(*self._bbox_ll))
-        len_m, _ = haversine(*_bbox_ll[1], *_bbox_ll[2])
+        lon, lat = self._bbox_ll
+        len_m, _ = haversine(lon[1], lat[1], lon[2], lat[2])
         return len_m
 
     @property
     def len_sample_m(self):
         """sample length, in meters"""
-        _bbox_ll = list(zip(*self._bbox_ll))
-        len_m, _ = haversine(*_bbox_ll[0], *_bbox_ll[1])
+        lon, lat = self._bbox_ll
+        len_m, _ = haversine(lon[0], lat[0], lon[1], lat[1])
         return len_m
 
     @property
@@ -100,37 +130,105 @@ class BaseDataset(ABC):
 
     @property
     def _regularly_spaced(self):
-        return (
-            max(
-                [
-                    np.unique(
-                        np.round(np.diff(self._dataset[dim].values), 1)).size
-                    for dim in ["line", "sample"]
-                ]
-            )
-            == 1
+        # cached with the bounding box, so `_step` and `recompute_attrs` share the same computation
+        cache = self._get_cache_bbox()
+        if "regular" not in cache:
+            # count distinct steps (0, 1, or "more") for each dim, without sorting them like np.unique
+            n_steps = []
+            for dim in ["line", "sample"]:
+                steps = np.round(np.diff(cache[dim]), 1)
+                if steps.size == 0:
+                    n_steps.append(0)
+                else:
+                    n_steps.append(1 if (steps == steps[0]).all() else 2)
+            cache["regular"] = max(n_steps) == 1
+        return cache["regular"]
+
+    def _dn_coords(self):
+        """
+        `line` and `sample` coordinates of `digital_number`, as `xarray.Coordinates`.
+        Variables and indexes are shared by reference (no copy of coordinates values, no index rebuild).
+        """
+        dn = self._dataset.digital_number
+        dims = ["line", "sample"]
+        return xr.Coordinates(
+            {d: dn.coords[d].variable for d in dims},
+            indexes={d: dn.xindexes[d] for d in dims},
         )
 
+    def _get_cache_bbox(self):
+        """
+        Cache dict for the bounding box properties, reset when the dataset line/sample coordinates change.
+        """
+        line = self._dataset.line.values
+        sample = self._dataset.sample.values
+        key = (line.size, line[0], line[-1], sample.size, sample[0], sample[-1])
+        if self._cache_bbox is None or self._cache_bbox["key"] != key:
+            self._cache_bbox = {"key": key, "line": line, "sample": sample}
+        return self._cache_bbox
+
+    def _step(self, dim):
+        """
+        Approximate pixel spacing along `dim` ('line' or 'sample'), cached with the bounding box.
+
+        If the dataset is regularly spaced (see `_regularly_spaced`, also cached), it's the mean step,
+        from the coordinates ends. Otherwise, it's the 90th percentile of the steps.
+        """
+        cache = self._get_cache_bbox()
+        if "step" not in cache:
+            cache["step"] = {}
+            regular = self._regularly_spaced
+            for d in ["line", "sample"]:
+                c = cache[d]
+                if c.size < 2:
+                    cache["step"][d] = 0
+                elif regular:
+                    cache["step"][d] = (c[-1] - c[0]) / (c.size - 1)
+                else:
+                    cache["step"][d] = np.percentile(np.diff(c), 90)
+        return cache["step"][dim]
+
     @property
     def _bbox_ll(self):
         """Dataset bounding box, lon/lat"""
-        return self.sar_meta.coords2ll(*zip(*self._bbox_coords))
+        cache = self._get_cache_bbox()
+        if "ll" not in cache:
+            # all corners at once, as numpy arrays
+            coords = self._bbox_coords
+            cache["ll"] = np.asarray(
+                self.sar_meta.coords2ll(coords[:, 0], coords[:, 1])
+            )
+        return cache["ll"]
 
     @property
     def _bbox_coords(self):
         """
-        Dataset bounding box, in line/sample coordinates
+        Dataset bounding box, in line/sample coordinates, as a (4, 2) array
         """
-        bbox_ext = bbox_coords(self.dataset.line.values,
-                               self.dataset.sample.values)
-        return bbox_ext
+        cache = self._get_cache_bbox()
+        if "coords" not in cache:
+            cache["coords"] = np.asarray(
+                bbox_coords(cache["line"], cache["sample"]), dtype=float
+            )
+        return cache["coords"]
+
+    @property
+    def _bbox_polygon(self):
+        """`_bbox_coords` as a `shapely.geometry.Polygon` (line/sample coordinates)"""
+        cache = self._get_cache_bbox()
+        if "polygon" not in cache:
+            cache["polygon"] = Polygon(self._bbox_coords)
+        return cache["polygon"]
 
     @property
     def geometry(self):
         """
         geometry of this dataset, as a `shapely.geometry.Polygon` (lon/lat coordinates)
         """
-        return Polygon(zip(*self._bbox_ll))
+        cache = self._get_cache_bbox()
+        if "geometry" not in cache:
+            cache["geometry"] = Polygon(self._bbox_ll.T)
+        return cache["geometry"]
 
     def load_ground_heading(self):
         """
@@ -148,8 +246,9 @@ class BaseDataset(ABC):
             )
 
         gh = map_blocks_coords(
-            self._da_tmpl.astype(self._dtypes["ground_heading"]),
+            self._da_tmpl,
             coords2heading,
+            dtype=self._dtypes["ground_heading"],
             name="ground_heading",
         )
 
@@ -248,29 +347,26 @@ class BaseDataset(ABC):
         else:
             scalar = True
 
-        tolerance = (
-            np.max(
-                [
-                    np.percentile(np.diff(self.dataset[c].values), 90) / 2
-                    for c in ["line", "sample"]
-                ]
-            )
-            + 1
-        )
-        try:
-            # select the nearest valid pixel in ds
-            ds_nearest = self.dataset.sel(
-                line=line, sample=sample, method="nearest", tolerance=tolerance
+        cache = self._get_cache_bbox()
+        if "tolerance" not in cache:
+            cache["tolerance"] = (
+                np.max([np.abs(self._step(c)) / 2 for c in ["line", "sample"]]) + 1
             )
+        tolerance = cache["tolerance"]
+
+        # select the nearest valid pixel in ds
+        if "increasing" not in cache:
+            # checked once, not at each lookup
+            cache["increasing"] = {d: _increasing(cache[d]) for d in ["line", "sample"]}
+        increasing = cache["increasing"]
+        nearest = [_nearest(increasing["line"], line), _nearest(increasing["sample"], sample)]
+        if all(np.all(np.abs(n - v) <= tolerance) for n, v in zip(nearest, [line, sample])):
             if scalar:
-                (line, sample) = (
-                    ds_nearest.line.values.item(),
-                    ds_nearest.sample.values.item(),
-                )
+                (line, sample) = (nearest[0].item(), nearest[1].item())
             else:
-                (line, sample) = (ds_nearest.line.values, ds_nearest.sample.values)
-        except KeyError:
-            # out of bounds, because of `tolerance` keyword
+                (line, sample) = nearest
+        else:
+            # out of bounds, because of `tolerance`
             (line, sample) = (line * np.nan, sample * np.nan)
 
         return line, sample
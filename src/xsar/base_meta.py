@@ -1,6 +1,7 @@
 import copy
 import logging
 import warnings
+from functools import cached_property
 
 import cartopy
 import rasterio
@@ -239,13 +240,11 @@ class BaseMeta(BaseDataset):
     def footprint(self):
         pass
 
-    @property
+    @cached_property
     def cross_antimeridian(self):
         """True if footprint cross antimeridian"""
-        return (
-            (np.max(self.geoloc["longitude"]) -
-             np.min(self.geoloc["longitude"])) > 180
-        ).item()
+        lon = np.asarray(self.geoloc["longitude"])
+        return bool(np.nanmax(lon) - np.nanmin(lon) > 180)
 
     @property
     def swath(self):
@@ -336,21 +335,38 @@ class BaseMeta(BaseDataset):
 
         return lon, lat
 
+    @cached_property
+    def _approx_affine_coords2ll(self):
+        # `approx_transform` as a `shapely.affinity.affine_transform` matrix
+        (xoff, a, b, yoff, d, e) = self.approx_transform.to_gdal()
+        return (a, b, d, e, xoff, yoff)
+
+    @cached_property
+    def _approx_affine_ll2coords(self):
+        # inverse of `approx_transform` as a `shapely.affinity.affine_transform` matrix
+        (xoff, a, b, yoff, d, e) = (~self.approx_transform).to_gdal()
+        return (a, b, d, e, xoff, yoff)
+
     def _ll2coords_shapely(self, shape, approx=False):
         if approx:
-            (xoff, a, b, yoff, d, e) = (~self.approx_transform).to_gdal()
-            return shapely.affinity.affine_transform(shape, (a, b, d, e, xoff, yoff))
+            return shapely.affinity.affine_transform(shape, self._approx_affine_ll2coords)
         else:
-            return shapely.ops.transform(self.ll2coords, shape)
+            return self._transform_shapely(self.ll2coords, shape)
 
     def _coords2ll_shapely(self, shape, approx=False):
         if approx:
-            (xoff, a, b, yoff, d, e) = self.approx_transform.to_gdal()
-            return shapely.affinity.affine_transform(shape, (a, b, d, e, xoff, yoff))
+            return shapely.affinity.affine_transform(shape, self._approx_affine_coords2ll)
         else:
-            return shapely.ops.transform(self.coords2ll, shape)
+            return self._transform_shapely(self.coords2ll, shape)
 
-    def ll2coords(self, *args):
+    @staticmethod
+    def _transform_shapely(func, shape):
+        # like `shapely.ops.transform`, but `func` is called once, with all the coordinates of `shape`
+        return shapely.transform(
+            shape, lambda coords: np.column_stack(func(coords[:, 0], coords[:, 1]))
+        )
+
+    def ll2coords(self, *args, approx=False, tol=None):
         """
         Get `(lines, samples)` from `(lon, lat)`,
         or convert a lon/lat shapely object to line/sample coordinates.
@@ -360,6 +376,13 @@ class BaseMeta(BaseDataset):
         *args: lon, lat or shapely object
             lon and lat might be iterables or scalars
 
+        approx: bool, default False
+            If True, only use `approx_transform` (fast, but with errors up to 600 meters).
+
+        tol: float, optional
+            If None (default), a single correction pass is done.
+            Otherwise, correction passes are repeated (at most 5) until the correction is below `tol` pixels.
+
         Returns
         -------
         tuple of np.array or tuple of float (lines, samples) , or a shapely object
@@ -380,7 +403,7 @@ class BaseMeta(BaseDataset):
         """
 
         if isinstance(args[0], shapely.geometry.base.BaseGeometry):
-            return self._ll2coords_shapely(args[0])
+            return self._ll2coords_shapely(args[0], approx=approx)
 
         lon, lat = args
 
@@ -389,22 +412,27 @@ class BaseMeta(BaseDataset):
             np.asarray(lon),
             np.asarray(lat),
         )
+        if approx:
+            return line_approx, sample_approx
+
+        line, sample = line_approx, sample_approx
+        for _ in range(1 if tol is None else 5):
+            # Theoretical identity. It should be the same, but the difference show the error.
+            lon_identity, lat_identity = self.coords2ll(line, sample, to_grid=False)
+            line_identity, sample_identity = ~self.approx_transform * (
+                lon_identity,
+                lat_identity,
+            )
 
-        # Theoretical identity. It should be the same, but the difference show the error.
-        lon_identity, lat_identity = self.coords2ll(
-            line_approx, sample_approx, to_grid=False
-        )
-        line_identity, sample_identity = ~self.approx_transform * (
-            lon_identity,
-            lat_identity,
-        )
+            # we are now able to compute the error, and make a correction
+            line_error = line_identity - line_approx
+            sample_error = sample_identity - sample_approx
 
-        # we are now able to compute the error, and make a correction
-        line_error = line_identity - line_approx
-        sample_error = sample_identity - sample_approx
+            line = line - line_error
+            sample = sample - sample_error
 
-        line = line_approx - line_error
-        sample = sample_approx - sample_error
+            if tol is not None and np.all(np.abs(line_error) < tol) and np.all(np.abs(sample_error) < tol):
+                break
 
         return line, sample
 
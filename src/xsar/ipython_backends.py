@@ -1,3 +1,5 @@
+import html
+
 try:
     # will fall back to repr if some modules are missing
 
@@ -8,48 +10,73 @@ try:
     import holoviews as hv
     import geoviews as gv
     import geoviews.feature as gf
-    import jinja2
     import geopandas as gpd
     import holoviews.ipython.display_hooks as display_hooks
-    from shapely.geometry import Polygon
 except (ModuleNotFoundError, AssertionError, NameError):
     pass
 
 
+# html template shared by notebook reprs
+_HTML_TEMPLATE = """
+<div align="left">
+    <h5>{intro}</h5>
+    <table style="width:100%">
+        <thead>
+            <tr>
+                <th colspan="2">{short_name}</th>
+            </tr>
+        </thead>
+        <tbody>
+            <tr>
+                <td>
+                    <table>
+{rows}
+                    </table>
+                </td>
+                <td>{location}</td>
+            </tr>
+        </tbody>
+    </table>
+
+</div>
+"""
+
+_HTML_ROW = """                         <tr>
+                             <th> {} </th>
+                             <td> {} </td>
+                         </tr>"""
+
+
+def _render_html(intro, short_name, properties, location):
+    """
+    Fill `_HTML_TEMPLATE` with plain `str.format` (no template engine).
+    Text is escaped, while `location` is already html.
+    """
+    rows = "\n".join(
+        _HTML_ROW.format(html.escape(str(key)), html.escape(str(value)))
+        for key, value in properties.items()
+    )
+    return _HTML_TEMPLATE.format(
+        intro=html.escape(str(intro)),
+        short_name=html.escape(str(short_name)),
+        rows=rows,
+        location=location,
+    )
+
+
+def _want_html(include=None, exclude=None):
+    """True if 'text/html' is allowed by `include` and `exclude` mimetypes filters"""
+    return (include is None or "text/html" in include) and (
+        exclude is None or "text/html" not in exclude
+    )
+
+
 def repr_mimebundle_Sentinel1Meta(self, include=None, exclude=None):
     """html output for notebook"""
 
-    template = jinja2.Template(
-        """
-        <div align="left">
-            <h5>{{ intro }}</h5>
-            <table style="width:100%">
-                <thead>
-                    <tr>
-                        <th colspan="2">{{ short_name }}</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    <tr>
-                        <td>
-                            <table>
-                                {% for key, value in properties.items() %}
-                                 <tr>
-                                     <th> {{ key }} </th>
-                                     <td> {{ value }} </td>
-                                 </tr>
-                                {% endfor %}
-                            </table>
-                        </td>
-                        <td>{{ location }}</td>
-                    </tr>
-                </tbody>
-            </table>
-
-        </div>
-
-        """
-    )
+    if not _want_html(include=include, exclude=exclude):
+        # no need to render the map
+        return {"text/plain": repr(self)}, {}
 
     crs = cartopy.crs.PlateCarree()
 
@@ -105,19 +132,22 @@ def repr_mimebundle_Sentinel1Meta(self, include=None, exclude=None):
     )
     data, metadata = display_hooks.render(location)
 
-    properties = self.to_dict()
-    properties["orbit_pass"] = self.orbit_pass
+    # None values are not inserted
+    properties = {k: v for k, v in self.to_dict().items() if v is not None}
+    orbit_pass = self.orbit_pass
+    if orbit_pass is not None:
+        properties["orbit_pass"] = orbit_pass
     if self.pixel_line_m is not None:
         properties["pixel size"] = "%.1f * %.1f meters (line * sample)" % (
             self.pixel_line_m,
             self.pixel_sample_m,
         )
-    properties["coverage"] = self.coverage
-    properties["start_date"] = self.start_date
-    properties["stop_date"] = self.stop_date
+    for key in ["coverage", "start_date", "stop_date"]:
+        value = getattr(self, key)
+        if value is not None:
+            properties[key] = value
     if len(self.subdatasets) > 0:
         properties["subdatasets"] = "list of %d subdatasets" % len(self.subdatasets)
-    properties = {k: v for k, v in properties.items() if v is not None}
 
     if self.multidataset:
         intro = "Multi (%d) dataset" % len(self.subdatasets)
@@ -126,7 +156,7 @@ def repr_mimebundle_Sentinel1Meta(self, include=None, exclude=None):
         properties["dsid"] = self.dsid
 
     if "text/html" in data:
-        data["text/html"] = template.render(
+        data["text/html"] = _render_html(
             intro=intro,
             short_name=self.short_name,
             properties=properties,
@@ -138,42 +168,14 @@ def repr_mimebundle_Sentinel1Meta(self, include=None, exclude=None):
 
 def repr_mimebundle_Sentinel1Dataset(self, include=None, exclude=None):
 
-    template = jinja2.Template(
-        """
-        <div align="left">
-            <h5>{{ intro }}</h5>
-            <table style="width:100%">
-                <thead>
-                    <tr>
-                        <th colspan="2">{{ short_name }}</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    <tr>
-                        <td>
-                            <table>
-                                {% for key, value in properties.items() %}
-                                 <tr>
-                                     <th> {{ key }} </th>
-                                     <td> {{ value }} </td>
-                                 </tr>
-                                {% endfor %}
-                            </table>
-                        </td>
-                        <td>{{ location }}</td>
-                    </tr>
-                </tbody>
-            </table>
-
-        </div>
-
-        """
-    )
+    if not _want_html(include=include, exclude=exclude):
+        # no need to render the grid
+        return {"text/plain": repr(self)}, {}
 
     opts = {"bokeh": dict(fill_color="cyan")}
     grid = (
-        hv.Path(Polygon(self._bbox_coords_ori)).opts(color="blue")
-        * hv.Polygons(Polygon(self._bbox_coords))
+        hv.Path(self._bbox_polygon_ori).opts(color="blue")
+        * hv.Polygons(self._bbox_polygon)
         .opts(color="blue")
         .opts(
             **(opts.get(hv.Store.current_backend) or {}),
@@ -188,8 +190,9 @@ def repr_mimebundle_Sentinel1Dataset(self, include=None, exclude=None):
             self.pixel_line_m,
             self.pixel_sample_m,
         )
-    properties["coverage"] = self.coverage
-    properties = {k: v for k, v in properties.items() if v is not None}
+    coverage = self.coverage
+    if coverage is not None:
+        properties["coverage"] = coverage
 
     if self.sliced:
         intro = "dataset slice"
@@ -197,7 +200,7 @@ def repr_mimebundle_Sentinel1Dataset(self, include=None, exclude=None):
         intro = "full dataset coverage"
 
     if "text/html" in data:
-        data["text/html"] = template.render(
+        data["text/html"] = _render_html(
             intro=intro,
             short_name=self.sar_meta.short_name,
             properties=properties,
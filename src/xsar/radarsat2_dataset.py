@@ -4,7 +4,7 @@ import warnings
 
 
 from .radarsat2_meta import RadarSat2Meta
-from .utils import timing, map_blocks_coords, BlockingActorProxy, to_lon180
+from .utils import timing, map_blocks_coords, BlockingActorProxy, to_lon180, BilinearInterpolator
 import numpy as np
 import rasterio.features
 import xarray as xr
@@ -74,7 +74,7 @@ class RadarSat2Dataset(BaseDataset):
         skip_variables=None,
     ):
         if skip_variables is None:
-            skip_variables = []
+            skip_variables = list(self._default_skip_variables)
         # default dtypes
         if dtypes is not None:
             self._dtypes.update(dtypes)
@@ -228,10 +228,7 @@ class RadarSat2Dataset(BaseDataset):
                         self.sar_meta.name),
                 ),
                 dims=("line", "sample"),
-                coords={
-                    "line": self._dataset.digital_number.line,
-                    "sample": self._dataset.digital_number.sample,
-                },
+                coords=self._dn_coords(),
             )
         # Add vars to define if lines or samples have been flipped to respect xsar convention
         self._dataset = xr.merge(
@@ -294,8 +291,9 @@ class RadarSat2Dataset(BaseDataset):
              'geolocation_annotation': self.datatree['geolocation_annotation'],
              'reader': self.sar_meta.dt})"""
         self._reconfigure_reader_datatree()
-        self._dataset.attrs.update(self.sar_meta.to_dict("all"))
-        self.datatree.attrs.update(self.sar_meta.to_dict("all"))
+        meta_attrs = self.sar_meta.to_dict("all")
+        self._dataset.attrs.update(meta_attrs)
+        self.datatree.attrs.update(meta_attrs)
 
         self.resampled = resolution is not None
 
@@ -316,6 +314,7 @@ class RadarSat2Dataset(BaseDataset):
                 lut_f_delayed.data,
                 (luts_ds[lut_name].data.size,),
                 luts_ds[lut_name].dtype,
+                meta=self._default_meta.astype(luts_ds[lut_name].dtype),
             )
             da = xr.DataArray(
                 data=ar,
@@ -356,7 +355,7 @@ class RadarSat2Dataset(BaseDataset):
     @timing
     def load_from_geoloc(self, varnames, lazy_loading=True):
         """
-        Interpolate (with RectBiVariateSpline) variables from `self.sar_meta.geoloc` to `self._dataset`
+        Interpolate (bilinear, with `xsar.utils.BilinearInterpolator`) variables from `self.sar_meta.geoloc` to `self._dataset`
 
         Parameters
         ----------
@@ -396,17 +395,15 @@ class RadarSat2Dataset(BaseDataset):
                         z_values = z_values % 360
                 else:
                     z_values = self.sar_meta.geoloc[varname_in_geoloc]
-                interp_func = RectBivariateSpline(
+                interp_func = BilinearInterpolator(
                     self.sar_meta.geoloc.line,
                     self.sar_meta.geoloc.pixel,
                     z_values,
-                    kx=1,
-                    ky=1,
                 )
                 typee = self.sar_meta.geoloc[varname_in_geoloc].dtype
                 if lazy_loading:
                     da_var = map_blocks_coords(
-                        self._da_tmpl.astype(typee), interp_func)
+                        self._da_tmpl, interp_func, dtype=typee)
                 else:
                     da_val = interp_func(
                         self._dataset.digital_number.line,
@@ -415,14 +412,13 @@ class RadarSat2Dataset(BaseDataset):
                     da_var = xr.DataArray(
                         data=da_val,
                         dims=["line", "sample"],
-                        coords={
-                            "line": self._dataset.digital_number.line,
-                            "sample": self._dataset.digital_number.sample,
-                        },
+                        coords=self._dn_coords(),
                     )
                 if varname == "longitude":
                     if self.sar_meta.cross_antimeridian:
-                        da_var.data = da_var.data.map_blocks(to_lon180)
+                        da_var.data = da_var.data.map_blocks(
+                            to_lon180, meta=np.empty((0, 0), da_var.dtype)
+                        )
 
                 da_var.name = varname
 
@@ -460,10 +456,7 @@ class RadarSat2Dataset(BaseDataset):
         return xr.DataArray(
             data=i_angle,
             dims=["line", "sample"],
-            coords={
-                "line": self._dataset.digital_number.line,
-                "sample": self._dataset.digital_number.sample,
-            },
+            coords=self._dn_coords(),
         )
 
     @timing
@@ -479,7 +472,7 @@ class RadarSat2Dataset(BaseDataset):
                               coords={'line': self._dataset.digital_number.line,
                                       'sample': self._dataset.digital_number.sample})"""
         da_var = map_blocks_coords(
-            self._da_tmpl.astype(lut.dtype), interp_func)
+            self._da_tmpl, interp_func, dtype=lut.dtype)
         return da_var
 
     @timing
@@ -561,7 +554,7 @@ class RadarSat2Dataset(BaseDataset):
             x=lines, y=indexes, z=noise_values_2d, kx=1, ky=1
         )
         da_var = map_blocks_coords(
-            self._da_tmpl.astype(self._dtypes["noise_lut"]), interp_func
+            self._da_tmpl, interp_func, dtype=self._dtypes["noise_lut"]
         )
         return da_var
 
@@ -600,19 +593,20 @@ class RadarSat2Dataset(BaseDataset):
         --------
 
         """
+        # collect new variables, to assign them in a single pass
+        new_vars = {}
         for var_name, lut_name in self._map_var_lut.items():
             if lut_name in self._luts:
-                # merge var_name into dataset (not denoised)
-                self._dataset = self._dataset.merge(
-                    self._apply_calibration_lut(var_name)
-                )
-                # merge noise equivalent for var_name (named 'ne%sz' % var_name[0)
-                self._dataset = self._dataset.merge(self._get_noise(var_name))
+                # var_name (not denoised)
+                new_vars.update(self._apply_calibration_lut(var_name).data_vars)
+                # noise equivalent for var_name (named 'ne%sz' % var_name[0)
+                new_vars.update(self._get_noise(var_name).data_vars)
             else:
                 logger.debug(
                     "Skipping variable '%s' ('%s' lut is missing)"
                     % (var_name, lut_name)
                 )
+        self._dataset = self._dataset.assign(new_vars)
         self._dataset = self._add_denoised(self._dataset)
 
         for var_name, lut_name in self._map_var_lut.items():
@@ -652,6 +646,8 @@ class RadarSat2Dataset(BaseDataset):
         """
         if vars is None:
             vars = ["sigma0", "beta0", "gamma0"]
+        # lazy denoised vars, assigned in a single pass
+        denoised_vars = {}
         for varname in vars:
             varname_raw = varname + "_raw"
             noise = "ne%sz" % varname[0]
@@ -665,8 +661,8 @@ class RadarSat2Dataset(BaseDataset):
                     denoised.attrs["comment"] = "clipped, no values <0"
                 else:
                     denoised.attrs["comment"] = "not clipped, some values can be <0"
-                ds[varname] = denoised
-        return ds
+                denoised_vars[varname] = denoised
+        return ds.assign(denoised_vars)
 
     @timing
     def _apply_calibration_lut(self, var_name):
@@ -687,7 +683,13 @@ class RadarSat2Dataset(BaseDataset):
         offset = lut.attrs["offset"]
         # if self.resolution is not None:
         lut = self._resample_lut_values(lut)
-        res = ((self._dataset.digital_number**2.0) + offset) / lut
+        dn = self._dataset.digital_number
+        if np.iscomplexobj(dn):
+            # |dn|**2, without the sqrt computed by np.abs
+            dn2 = dn.real * dn.real + dn.imag * dn.imag
+        else:
+            dn2 = dn**2.0
+        res = (dn2 + offset) / lut
         res.attrs.update(lut.attrs)
         return res.to_dataset(name=var_name + "_raw")
 
@@ -766,7 +768,7 @@ class RadarSat2Dataset(BaseDataset):
             x=lines, y=samples, z=time_values_2d.astype(float), kx=1, ky=1
         )
         da_var = map_blocks_coords(
-            self._da_tmpl.astype("datetime64[ns]"), interp_func)
+            self._da_tmpl, interp_func, dtype="datetime64[ns]")
         return da_var.isel(sample=0).to_dataset(name="time")
 
     def get_sensor_velocity(self):
@@ -910,13 +912,12 @@ class RadarSat2Dataset(BaseDataset):
             # check if new ds has changed coordinates
             if not self.sliced:
                 self.sliced = any(
-                    [
-                        list(ds[d].values) != list(self._dataset[d].values)
-                        for d in ["line", "sample"]
-                    ]
+                    not np.array_equal(ds[d].values, self._dataset[d].values)
+                    for d in ["line", "sample"]
                 )
             self._dataset = ds
             # self._dataset = self.datatree['measurement'].ds
+            self._cache_bbox = None
             self.recompute_attrs()
         else:
             raise ValueError("dataset must be same kind as original one.")
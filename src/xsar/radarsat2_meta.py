@@ -1,12 +1,13 @@
 import pdb
+from functools import cached_property
 
 import pandas as pd
 import rasterio
 from rasterio.control import GroundControlPoint
-from scipy.interpolate import RectBivariateSpline, interp1d
+from scipy.interpolate import interp1d
 from shapely.geometry import Polygon
 
-from .utils import haversine, timing
+from .utils import BilinearInterpolator, haversine, timing
 import os
 import geopandas as gpd
 import numpy as np
@@ -76,6 +77,12 @@ class RadarSat2Meta(BaseMeta):
         self.subdatasets = gpd.GeoDataFrame(geometry=[], index=[])
         """Subdatasets as GeodataFrame (empty if single dataset)"""
         self.geoloc = self.dt["geolocationGrid"].to_dataset()
+        # raw numpy geoloc arrays, used by footprint, approx_transform and coords2ll
+        geoloc = self.geoloc.transpose("line", "pixel", ...)
+        self._line_idx = np.asarray(geoloc.line.values)
+        self._pixel_idx = np.asarray(geoloc.pixel.values)
+        self._lon_grid = np.ascontiguousarray(geoloc["longitude"].values, dtype=np.float64)
+        self._lat_grid = np.ascontiguousarray(geoloc["latitude"].values, dtype=np.float64)
 
         self.orbit_and_attitude = self.dt["orbitAndAttitude"].ds
         self.doppler_centroid = self.dt["imageGenerationParameters"]["doppler"][
@@ -100,14 +107,9 @@ class RadarSat2Meta(BaseMeta):
         dic["start_date"] = self.start_date
         dic["stop_date"] = self.stop_date
         # compute attributes (footprint, coverage, pixel_size)
-        footprint_dict = {}
-        for ll in ["longitude", "latitude"]:
-            footprint_dict[ll] = [
-                self.geoloc[ll].isel(line=a, pixel=x).values
-                for a, x in [(0, 0), (0, -1), (-1, -1), (-1, 0)]
-            ]
-        corners = list(
-            zip(footprint_dict["longitude"], footprint_dict["latitude"]))
+        corners_idx = ([0, 0, -1, -1], [0, -1, -1, 0])
+        corners = np.column_stack(
+            [self._lon_grid[corners_idx], self._lat_grid[corners_idx]])
         p = Polygon(corners)
         self.geoloc.attrs["footprint"] = p
         dic["footprints"] = p
@@ -120,27 +122,9 @@ class RadarSat2Meta(BaseMeta):
             acq_line_meters / 1000,
             acq_sample_meters / 1000,
         )
-
-        def _to_rio_gcp(pt_geoloc):
-            # convert a point from self._geoloc grid to rasterio GroundControlPoint
-            return GroundControlPoint(
-                x=pt_geoloc.longitude.item(),
-                y=pt_geoloc.latitude.item(),
-                z=pt_geoloc.height.item(),
-                col=pt_geoloc.line.item(),
-                row=pt_geoloc.pixel.item(),
-            )
-
-        gcps = [
-            _to_rio_gcp(self.geoloc.sel(line=line, pixel=sample))
-            for line in self.geoloc.line
-            for sample in self.geoloc.pixel
-        ]
-        # approx transform, from all gcps (inaccurate)
-        dic["approx_transform"] = rasterio.transform.from_gcps(gcps)
         return dic
 
-    @property
+    @cached_property
     def approx_transform(self):
         """
         Affine transfom from geoloc.
@@ -167,7 +151,23 @@ class RadarSat2Meta(BaseMeta):
         xsar.BaseMeta.ll2coords
 
         """
-        return self.manifest_attrs["approx_transform"]
+        # convert self.geoloc grid to a list of rasterio GroundControlPoint
+        heights = self.geoloc["height"].transpose("line", "pixel").values
+        shape = self._lon_grid.shape
+        lines = np.broadcast_to(self._line_idx[:, np.newaxis], shape)
+        samples = np.broadcast_to(self._pixel_idx[np.newaxis, :], shape)
+        gcps = [
+            GroundControlPoint(x=lon, y=lat, z=height, col=line, row=sample)
+            for lon, lat, height, line, sample in zip(
+                self._lon_grid.ravel().tolist(),
+                self._lat_grid.ravel().tolist(),
+                heights.ravel().tolist(),
+                lines.ravel().tolist(),
+                samples.ravel().tolist(),
+            )
+        ]
+        # approx transform, from all gcps (inaccurate)
+        return rasterio.transform.from_gcps(gcps)
 
     def to_dict(self, keys="minimal"):
 
@@ -187,7 +187,7 @@ class RadarSat2Meta(BaseMeta):
             "coverage",
             "pixel_line_m",
             "pixel_sample_m",
-            "approx_transform",
+            # 'approx_transform' is not included, so opening a dataset does not fit it from the gcps
             # 'orbit_pass',
             # 'platform_heading'
         ]
@@ -279,10 +279,11 @@ class RadarSat2Meta(BaseMeta):
             meta_type = "single"
         return "<RadarSat2Meta %s object>" % meta_type
 
-    @property
+    @cached_property
     def _dict_coords2ll(self):
         """
-        dict with keys ['longitude', 'latitude'] with interpolation function (RectBivariateSpline) as values.
+        dict with keys ['longitude', 'latitude'] with interpolation function (`xsar.utils.BilinearInterpolator`) as values.
+        Interpolators are built on first access, and cached for the lifetime of the instance.
 
         Examples:
         ---------
@@ -295,18 +296,14 @@ class RadarSat2Meta(BaseMeta):
         ------
             if self.cross_antimeridian is True, 'longitude' will be in range [0, 360]
         """
-        resdict = {}
-        geoloc = self.geoloc
+        grids = {"longitude": self._lon_grid, "latitude": self._lat_grid}
         if self.cross_antimeridian:
-            geoloc["longitude"] = geoloc["longitude"] % 360
-
-        idx_sample = np.array(geoloc.pixel)
-        idx_line = np.array(geoloc.line)
+            # work on a copy, so self.geoloc is left untouched
+            grids["longitude"] = grids["longitude"] % 360
 
-        for ll in ["longitude", "latitude"]:
-            resdict[ll] = RectBivariateSpline(
-                idx_line, idx_sample, np.asarray(geoloc[ll]), kx=1, ky=1
-            )
+        resdict = {}
+        for ll, grid in grids.items():
+            resdict[ll] = BilinearInterpolator(self._line_idx, self._pixel_idx, grid)
 
         return resdict
 
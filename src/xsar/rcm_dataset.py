@@ -3,6 +3,7 @@ import glob
 import logging
 import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import rasterio
 import yaml
@@ -10,7 +11,14 @@ from affine import Affine
 
 from .rcm_meta import RcmMeta
 import numpy as np
-from .utils import timing, map_blocks_coords, BlockingActorProxy, to_lon180, get_glob
+from .utils import (
+    timing,
+    map_blocks_coords,
+    BlockingActorProxy,
+    to_lon180,
+    get_glob,
+    BilinearInterpolator,
+)
 from scipy.interpolate import RectBivariateSpline, interp1d
 import dask
 import xarray as xr
@@ -68,6 +76,10 @@ class RcmDataset(BaseDataset):
 
     """
 
+    # TODO : Remove `velocity` from the skip_variable when the problem is resolved
+    #  (must understand link between time and lines)
+    _default_skip_variables = ["velocity"]
+
     def __init__(
         self,
         dataset_id,
@@ -79,9 +91,7 @@ class RcmDataset(BaseDataset):
         skip_variables=None,
     ):
         if skip_variables is None:
-            # TODO : Remove `velocity` from the skip_variable when the problem is resolved
-            #  (must understand link between time and lines)
-            skip_variables = ["velocity"]
+            skip_variables = list(self._default_skip_variables)
         # default dtypes
         if dtypes is not None:
             self._dtypes.update(dtypes)
@@ -207,10 +217,7 @@ class RcmDataset(BaseDataset):
                         self.sar_meta.name),
                 ),
                 dims=("line", "sample"),
-                coords={
-                    "line": self._dataset.digital_number.line,
-                    "sample": self._dataset.digital_number.sample,
-                },
+                coords=self._dn_coords(),
             )
 
             # Add vars to define if lines or samples have been flipped to respect xsar convention
@@ -269,8 +276,9 @@ class RcmDataset(BaseDataset):
         # merge the datatree with the reader
 
         self.reconfigure_reader_datatree()
-        self._dataset.attrs.update(self.sar_meta.to_dict("all"))
-        self.datatree.attrs.update(self.sar_meta.to_dict("all"))
+        meta_attrs = self.sar_meta.to_dict("all")
+        self._dataset.attrs.update(meta_attrs)
+        self.datatree.attrs.update(meta_attrs)
 
     def lazy_load_luts(self):
         """
@@ -295,7 +303,10 @@ class RcmDataset(BaseDataset):
                 values_nb = lut.attrs["numberOfValues"]
                 lut_f_delayed = dask.delayed()(lut)
                 ar = dask.array.from_delayed(
-                    lut_f_delayed.data, (values_nb,), lut.dtype
+                    lut_f_delayed.data,
+                    (values_nb,),
+                    lut.dtype,
+                    meta=self._default_meta.astype(lut.dtype),
                 )
                 da = xr.DataArray(
                     data=ar,
@@ -338,7 +349,10 @@ class RcmDataset(BaseDataset):
                 )
                 lut_f_delayed = dask.delayed()(lut)
                 ar = dask.array.from_delayed(
-                    lut_f_delayed.data, (values_nb,), lut.dtype
+                    lut_f_delayed.data,
+                    (values_nb,),
+                    lut.dtype,
+                    meta=self._default_meta.astype(lut.dtype),
                 )
                 da = xr.DataArray(
                     data=ar,
@@ -398,7 +412,7 @@ class RcmDataset(BaseDataset):
         interp_func = dask.delayed(RectBivariateSpline)(
             x=lines, y=samples, z=var_2d, kx=1, ky=1
         )
-        da_var = map_blocks_coords(self._da_tmpl.astype(var_type), interp_func)
+        da_var = map_blocks_coords(self._da_tmpl, interp_func, dtype=var_type)
         return da_var
 
     @timing
@@ -418,7 +432,13 @@ class RcmDataset(BaseDataset):
         """
         lut = self._get_lut(var_name)
         offset = lut.attrs["offset"]
-        res = ((self._dataset.digital_number**2.0) + offset) / lut
+        dn = self._dataset.digital_number
+        if np.iscomplexobj(dn):
+            # |dn|**2, without the sqrt computed by np.abs
+            dn2 = dn.real * dn.real + dn.imag * dn.imag
+        else:
+            dn2 = dn**2.0
+        res = (dn2 + offset) / lut
         res.attrs.update(lut.attrs)
         return res.to_dataset(name=var_name + "_raw")
 
@@ -459,19 +479,20 @@ class RcmDataset(BaseDataset):
         --------
 
         """
+        # collect new variables, to assign them in a single pass
+        new_vars = {}
         for var_name, lut_name in self._map_var_lut.items():
             if lut_name in self._luts:
-                # merge var_name into dataset (not denoised)
-                self._dataset = self._dataset.merge(
-                    self._apply_calibration_lut(var_name)
-                )
-                # merge noise equivalent for var_name (named 'ne%sz' % var_name[0)
-                self._dataset = self._dataset.merge(self._get_noise(var_name))
+                # var_name (not denoised)
+                new_vars.update(self._apply_calibration_lut(var_name).data_vars)
+                # noise equivalent for var_name (named 'ne%sz' % var_name[0)
+                new_vars.update(self._get_noise(var_name).data_vars)
             else:
                 logger.debug(
                     "Skipping variable '%s' ('%s' lut is missing)"
                     % (var_name, lut_name)
                 )
+        self._dataset = self._dataset.assign(new_vars)
 
         self._dataset = self._add_denoised(self._dataset)
 
@@ -515,6 +536,8 @@ class RcmDataset(BaseDataset):
 
         if vars is None:
             vars = ["sigma0", "beta0", "gamma0"]
+        # lazy denoised vars, assigned in a single pass
+        denoised_vars = {}
         for varname in vars:
             varname_raw = varname + "_raw"
             noise = "ne%sz" % varname[0]
@@ -529,7 +552,7 @@ class RcmDataset(BaseDataset):
                         denoised.attrs["comment"] = "clipped, no values <0"
                     else:
                         denoised.attrs["comment"] = "not clipped, some values can be <0"
-                    ds[varname] = denoised
+                    denoised_vars[varname] = denoised
 
                     ds[varname_raw].attrs[
                         "denoising information"
@@ -548,14 +571,15 @@ class RcmDataset(BaseDataset):
                         denoised.attrs["comment"] = "clipped, no values <0"
                     else:
                         denoised.attrs["comment"] = "not clipped, some values can be <0"
-                    ds[varname] = denoised
+                    denoised_vars[varname] = denoised
 
-                    ds[varname_raw] = denoised + ds[noise]
-                    ds[varname_raw].attrs[
+                    raw = denoised + ds[noise]
+                    raw.attrs[
                         "denoising information"
                     ] = "product was already denoised by Canadian Space Agency, noise added back"
+                    denoised_vars[varname_raw] = raw
 
-        return ds
+        return ds.assign(denoised_vars)
 
     def _load_incidence_from_lut(self):
         """
@@ -571,7 +595,10 @@ class RcmDataset(BaseDataset):
         values_nb = incidence.attrs["numberOfValues"]
         lut_f_delayed = dask.delayed()(angles)
         ar = dask.array.from_delayed(
-            lut_f_delayed.data, (values_nb,), self._dtypes["incidence"]
+            lut_f_delayed.data,
+            (values_nb,),
+            self._dtypes["incidence"],
+            meta=self._default_meta.astype(self._dtypes["incidence"]),
         )
         da = xr.DataArray(
             data=ar,
@@ -635,7 +662,7 @@ class RcmDataset(BaseDataset):
     @timing
     def load_from_geoloc(self, varnames, lazy_loading=True):
         """
-        Interpolate (with RectBiVariateSpline) variables from `self.sar_meta.geoloc` to `self._dataset`
+        Interpolate (bilinear, with `xsar.utils.BilinearInterpolator`) variables from `self.sar_meta.geoloc` to `self._dataset`
 
         Parameters
         ----------
@@ -677,17 +704,15 @@ class RcmDataset(BaseDataset):
                         z_values = z_values % 360
                 else:
                     z_values = self.sar_meta.geoloc[varname_in_geoloc]
-                interp_func = RectBivariateSpline(
+                interp_func = BilinearInterpolator(
                     self.sar_meta.geoloc.line,
                     self.sar_meta.geoloc.pixel,
                     z_values,
-                    kx=1,
-                    ky=1,
                 )
                 typee = self.sar_meta.geoloc[varname_in_geoloc].dtype
                 if lazy_loading:
                     da_var = map_blocks_coords(
-                        self._da_tmpl.astype(typee), interp_func)
+                        self._da_tmpl, interp_func, dtype=typee)
                 else:
                     da_val = interp_func(
                         self._dataset.digital_number.line,
@@ -696,14 +721,13 @@ class RcmDataset(BaseDataset):
                     da_var = xr.DataArray(
                         data=da_val,
                         dims=["line", "sample"],
-                        coords={
-                            "line": self._dataset.digital_number.line,
-                            "sample": self._dataset.digital_number.sample,
-                        },
+                        coords=self._dn_coords(),
                     )
                 if varname == "longitude":
                     if self.sar_meta.cross_antimeridian:
-                        da_var.data = da_var.data.map_blocks(to_lon180)
+                        da_var.data = da_var.data.map_blocks(
+                            to_lon180, meta=np.empty((0, 0), da_var.dtype)
+                        )
 
                 da_var.name = varname
 
@@ -737,7 +761,7 @@ class RcmDataset(BaseDataset):
             x=lines, y=samples, z=time_values_2d.astype(float), kx=1, ky=1
         )
         da_var = map_blocks_coords(
-            self._da_tmpl.astype("datetime64[ns]"), interp_func)
+            self._da_tmpl, interp_func, dtype="datetime64[ns]")
         return da_var.isel(sample=0).to_dataset(name="time")
 
     def get_sensor_velocity(self):
@@ -835,9 +859,6 @@ class RcmDataset(BaseDataset):
         else:
             comment = "read at full resolution"
 
-        # arbitrary rio object, to get shape, etc ... (will not be used to read data)
-        rio = rasterio.open(tiff_files[0])
-
         chunks["pol"] = 1
         # sort chunks keys like map_dims
         chunks = dict(
@@ -851,15 +872,17 @@ class RcmDataset(BaseDataset):
             # using tiff driver: need to read individual tiff and concat them
             # riofiles['rio'] is ordered like self.s1meta.manifest_attrs['polarizations']
 
-            dn = xr.concat(
-                [
-                    rioxarray.open_rasterio(
-                        f, chunks=chunks_rio, parse_coordinates=False
+            # open tiff files concurrently (headers reads are slow on remote storage)
+            with ThreadPoolExecutor(max_workers=len(tiff_files)) as executor:
+                rio_dns = list(
+                    executor.map(
+                        lambda f: rioxarray.open_rasterio(
+                            f, chunks=chunks_rio, parse_coordinates=False
+                        ),
+                        tiff_files,
                     )
-                    for f in tiff_files
-                ],
-                "band",
-            ).assign_coords(band=np.arange(len(pols)) + 1)
+                )
+            dn = xr.concat(rio_dns, "band").assign_coords(band=np.arange(len(pols)) + 1)
 
             # set dimensions names
             dn = dn.rename(dict(zip(map_dims.values(), map_dims.keys())))
@@ -868,6 +891,10 @@ class RcmDataset(BaseDataset):
             dn = dn.assign_coords({"line": dn.line, "sample": dn.sample})
             dn = dn.drop_vars("spatial_ref", errors="ignore")
         else:
+            # arbitrary rio object, to get shape, etc ... (will not be used to read data)
+            # (only needed here: at full resolution, rioxarray already reads the headers)
+            rio = rasterio.open(tiff_files[0])
+
             if not isinstance(resolution, dict):
                 if isinstance(resolution, str) and resolution.endswith("m"):
                     resolution = float(resolution[:-1])
@@ -896,20 +923,50 @@ class RcmDataset(BaseDataset):
                     rio.width // resolution["sample"] * resolution["sample"],
                     rio.height // resolution["line"] * resolution["line"],
                 )
-                window = rasterio.windows.Window(*winsize)
             else:
-                window = None
+                winsize = (0, 0, rio.width, rio.height)
+            # size of an output pixel, in full resolution pixels
+            step_sample = winsize[2] / out_shape[1]
+            step_line = winsize[3] / out_shape[0]
+            # output pixels are full resolution pixels: plain read, no resampling needed
+            native = step_sample == 1 and step_line == 1
+
+            def _read_resampled_block(block, tiff_file=None, block_info=None):
+                # read and resample only the full resolution window needed by this block
+                _, (line_start, line_stop), (sample_start, sample_stop) = block_info[None][
+                    "array-location"
+                ]
+                if native:
+                    window = rasterio.windows.Window(
+                        winsize[0] + sample_start,
+                        winsize[1] + line_start,
+                        sample_stop - sample_start,
+                        line_stop - line_start,
+                    )
+                    with rasterio.open(tiff_file) as src:
+                        return src.read(window=window)
+                window = rasterio.windows.Window(
+                    winsize[0] + sample_start * step_sample,
+                    winsize[1] + line_start * step_line,
+                    (sample_stop - sample_start) * step_sample,
+                    (line_stop - line_start) * step_line,
+                )
+                with rasterio.open(tiff_file) as src:
+                    return src.read(
+                        out_shape=block.shape, resampling=resampling, window=window
+                    )
 
+            dtype = np.dtype(rio.dtypes[0])
+            tmpl = dask.array.empty(
+                out_shape_pol, chunks=tuple(chunks_rio.values()), dtype=dtype
+            )
             dn = xr.concat(
                 [
                     xr.DataArray(
-                        dask.array.from_array(
-                            rasterio.open(f).read(
-                                out_shape=out_shape_pol,
-                                resampling=resampling,
-                                window=window,
-                            ),
-                            chunks=chunks_rio,
+                        tmpl.map_blocks(
+                            _read_resampled_block,
+                            tiff_file=f,
+                            meta=np.empty((0,) * tmpl.ndim, dtype),
                         ),
                         dims=tuple(map_dims.keys()),
                         coords={"pol": [pol]},
@@ -1050,13 +1107,12 @@ class RcmDataset(BaseDataset):
             # check if new ds has changed coordinates
             if not self.sliced:
                 self.sliced = any(
-                    [
-                        list(ds[d].values) != list(self._dataset[d].values)
-                        for d in ["line", "sample"]
-                    ]
+                    not np.array_equal(ds[d].values, self._dataset[d].values)
+                    for d in ["line", "sample"]
                 )
             self._dataset = ds
             # self._dataset = self.datatree['measurement'].ds
+            self._cache_bbox = None
             self.recompute_attrs()
         else:
             raise ValueError("dataset must be same kind as original one.")
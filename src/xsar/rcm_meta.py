@@ -1,9 +1,10 @@
+from functools import cached_property
+
 import rasterio
 from rasterio.control import GroundControlPoint
-from scipy.interpolate import RectBivariateSpline
 from shapely.geometry import Polygon
 
-from .utils import haversine, timing
+from .utils import BilinearInterpolator, haversine, timing
 from .base_meta import BaseMeta
 import os
 import numpy as np
@@ -245,27 +246,9 @@ class RcmMeta(BaseMeta):
             acq_line_meters / 1000,
             acq_sample_meters / 1000,
         )
-
-        def _to_rio_gcp(pt_geoloc):
-            # convert a point from self._geoloc grid to rasterio GroundControlPoint
-            return GroundControlPoint(
-                x=pt_geoloc.longitude.item(),
-                y=pt_geoloc.latitude.item(),
-                z=pt_geoloc.height.item(),
-                col=pt_geoloc.line.item(),
-                row=pt_geoloc.pixel.item(),
-            )
-
-        gcps = [
-            _to_rio_gcp(self.geoloc.sel(line=line, pixel=sample))
-            for line in self.geoloc.line
-            for sample in self.geoloc.pixel
-        ]
-        # approx transform, from all gcps (inaccurate)
-        dic["approx_transform"] = rasterio.transform.from_gcps(gcps)
         return dic
 
-    @property
+    @cached_property
     def approx_transform(self):
         """
         Affine transfom from geoloc.
@@ -292,7 +275,23 @@ class RcmMeta(BaseMeta):
         xsar.BaseMeta.ll2coords
 
         """
-        return self.manifest_attrs["approx_transform"]
+        # convert self.geoloc grid to a list of rasterio GroundControlPoint
+        geoloc = self.geoloc.transpose("line", "pixel", ...)
+        shape = (geoloc.line.size, geoloc.pixel.size)
+        lines = np.broadcast_to(geoloc.line.values[:, np.newaxis], shape)
+        samples = np.broadcast_to(geoloc.pixel.values[np.newaxis, :], shape)
+        gcps = [
+            GroundControlPoint(x=lon, y=lat, z=height, col=line, row=sample)
+            for lon, lat, height, line, sample in zip(
+                geoloc["longitude"].values.ravel().tolist(),
+                geoloc["latitude"].values.ravel().tolist(),
+                geoloc["height"].values.ravel().tolist(),
+                lines.ravel().tolist(),
+                samples.ravel().tolist(),
+            )
+        ]
+        # approx transform, from all gcps (inaccurate)
+        return rasterio.transform.from_gcps(gcps)
 
     @property
     def footprint(self):
@@ -365,10 +364,11 @@ class RcmMeta(BaseMeta):
             closed="both",
         )
 
-    @property
+    @cached_property
     def _dict_coords2ll(self):
         """
-        dict with keys ['longitude', 'latitude'] with interpolation function (RectBivariateSpline) as values.
+        dict with keys ['longitude', 'latitude'] with interpolation function (`xsar.utils.BilinearInterpolator`) as values.
+        Interpolators are built on first access, and cached for the lifetime of the instance.
 
         Examples:
         ---------
@@ -383,16 +383,15 @@ class RcmMeta(BaseMeta):
         """
         resdict = {}
         geoloc = self.geoloc
-        if self.cross_antimeridian:
-            geoloc["longitude"] = geoloc["longitude"] % 360
-
         idx_sample = np.array(geoloc.pixel)
         idx_line = np.array(geoloc.line)
+        grids = {ll: np.asarray(geoloc[ll]) for ll in ["longitude", "latitude"]}
+        if self.cross_antimeridian:
+            # work on a copy, so self.geoloc is left untouched
+            grids["longitude"] = grids["longitude"] % 360
 
-        for ll in ["longitude", "latitude"]:
-            resdict[ll] = RectBivariateSpline(
-                idx_line, idx_sample, np.asarray(geoloc[ll]), kx=1, ky=1
-            )
+        for ll, grid in grids.items():
+            resdict[ll] = BilinearInterpolator(idx_line, idx_sample, grid)
 
         return resdict
 
@@ -414,7 +413,7 @@ class RcmMeta(BaseMeta):
             "coverage",
             "pixel_line_m",
             "pixel_sample_m",
-            "approx_transform",
+            # 'approx_transform' is not included, so opening a dataset does not fit it from the gcps
             # 'orbit_pass',
             # 'platform_heading'
         ]
@@ -2,6 +2,7 @@
 
 import logging
 import warnings
+from functools import cached_property
 import numpy as np
 import xarray
 from scipy.interpolate import RectBivariateSpline
@@ -9,7 +10,7 @@ import xarray as xr
 import dask
 import rasterio.features
 from scipy.interpolate import interp1d
-from shapely.geometry import box
+from shapely.geometry import box, Polygon
 
 from .utils import (
     timing,
@@ -18,6 +19,7 @@ from .utils import (
     merge_yaml,
     to_lon180,
     config,
+    BilinearInterpolator,
 
     get_path_aux_cal,
     get_path_aux_pp1,
@@ -56,6 +58,39 @@ mapping_dataset_geoloc = {
 }
 
 
+def _block_meta(func, *args):
+    """
+    meta (empty numpy array) of `func(*args)` result, with `args` as `xarray.DataArray`.
+    `func` is evaluated on empty arrays, so the dtype is exactly the one of computed blocks.
+    """
+    ndim = max(arg.ndim for arg in args)
+    return func(*[np.empty((0,) * ndim, arg.dtype) for arg in args])
+
+
+def _calibrate_block(dn, lut_sq):
+    """`abs(dn) ** 2 / lut_sq`, fused for one numpy block (no intermediate dask arrays)"""
+    if np.iscomplexobj(dn):
+        res = dn.real * dn.real
+        res += dn.imag * dn.imag
+    else:
+        res = np.abs(dn) ** 2.0
+    return res / lut_sq
+
+
+def _uncalibrate_block(da_var, lut_sq):
+    """`sqrt(da_var * lut_sq)`, with 0 where `da_var` is nan, fused for one numpy block"""
+    res = np.where(np.isnan(da_var), 0, da_var * lut_sq)
+    return np.sqrt(res, out=res)
+
+
+def _denoise_block(raw, noise, clip=False):
+    """`raw - noise`, clipped to 0 if `clip`, fused for one numpy block"""
+    res = raw - noise
+    if clip:
+        np.maximum(res, 0, out=res)
+    return res
+
+
 # noinspection PyTypeChecker
 class Sentinel1Dataset(BaseDataset):
     """
@@ -102,6 +137,16 @@ class Sentinel1Dataset(BaseDataset):
     lazyloading: bool, optional
         activate or not the lazy loading of the high resolution fields
 
+    lut_chunks: dict, optional
+
+        dict with keys ['line','sample'] (dask chunks) used to evaluate luts.
+        Luts are smooth, so bigger chunks than `chunks` reduce the number of evaluations.
+        If None (default), `chunks` is used.
+
+    skip_variables: list, optional
+
+        list of strings eg ['land_mask','longitude'] to skip at rasterisation step (GRD products only).
+
     """
 
     def __init__(
@@ -115,6 +160,8 @@ class Sentinel1Dataset(BaseDataset):
         patch_variable=True,
         lazyloading=True,
         recalibration=False,
+        lut_chunks=None,
+        skip_variables=None,
     ):
         # default dtypes
         if dtypes is not None:
@@ -332,12 +379,8 @@ class Sentinel1Dataset(BaseDataset):
                         % dask.base.tokenize(self.sar_meta.name),
                     ),
                     dims=("line", "sample"),
-                    coords={
-                        "line": self._dataset.digital_number.line,
-                        "sample": self._dataset.digital_number.sample,
-                        "line_time": line_time.astype(float),
-                    },
-                )
+                    coords=self._dn_coords(),
+                ).assign_coords(line_time=line_time.astype(float).variable)
             else:
 
                 self._da_tmpl = xr.DataArray(
@@ -348,10 +391,7 @@ class Sentinel1Dataset(BaseDataset):
                         % dask.base.tokenize(self.sar_meta.name),
                     ),
                     dims=("line", "sample"),
-                    coords={
-                        "line": self._dataset.digital_number.line,
-                        "sample": self._dataset.digital_number.sample,
-                    },
+                    coords=self._dn_coords(),
                 )
         # FIXME possible memory leak
         # when calling a self.sar_meta method, an ActorFuture is returned.
@@ -371,7 +411,11 @@ class Sentinel1Dataset(BaseDataset):
 
         if "GRD" in str(self.datatree.attrs["product"]):
             self.add_high_resolution_variables(
-                patch_variable=patch_variable, luts=luts, lazy_loading=lazyloading
+                patch_variable=patch_variable,
+                luts=luts,
+                lazy_loading=lazyloading,
+                lut_chunks=lut_chunks,
+                skip_variables=skip_variables,
             )
             if self.apply_recalibration:
                 self.select_gains_for_recalibration()
@@ -394,6 +438,11 @@ class Sentinel1Dataset(BaseDataset):
         # save original bbox
         self._bbox_coords_ori = self._bbox_coords
 
+    @cached_property
+    def _bbox_polygon_ori(self):
+        """original `_bbox_coords_ori` as a `shapely.geometry.Polygon` (line/sample coordinates)"""
+        return Polygon(self._bbox_coords_ori)
+
     def corrected_range_noise_lut(self, dt):
         """
         Patch F.Nouguier see https://jira-projects.cls.fr/browse/MPCS-3581 and https://github.com/umr-lops/xsar_slc/issues/175
@@ -503,6 +552,7 @@ class Sentinel1Dataset(BaseDataset):
         skip_variables=None,
         load_luts=True,
         lazy_loading=True,
+        lut_chunks=None,
     ):
         """
         Parameters
@@ -521,8 +571,11 @@ class Sentinel1Dataset(BaseDataset):
             True -> load hiddens luts sigma0 beta0 gamma0, False -> no luts reading
 
         lazy_loading : bool
-            True -> use map_blocks_coords() to have delayed rasterization on variables such as longitude, latitude, incidence,..., False -> directly compute RectBivariateSpline with memory usage
+            True -> use map_blocks_coords() to have delayed rasterization on variables such as longitude, latitude, incidence,..., False -> directly compute the interpolation with memory usage
             (Currently the lazy_loading generate a memory leak)
+
+        lut_chunks: dict, optional
+            dict with keys ['line','sample'] (dask chunks) used to evaluate luts. If None, use the dataset chunks.
         """
         if "longitude" in self.dataset:
             logger.debug(
@@ -559,6 +612,14 @@ class Sentinel1Dataset(BaseDataset):
                 "noise_lut_azi": "noise",
             }
 
+            # dict mapping lut names to the variables computed from them
+            self._map_lut_vars = {
+                "sigma0_lut": ["sigma0_raw", "nesz", "sigma0"],
+                "gamma0_lut": ["gamma0_raw", "negz", "gamma0"],
+                "noise_lut_range": ["noise_lut", "nesz", "negz", "sigma0", "gamma0"],
+                "noise_lut_azi": ["noise_lut", "nesz", "negz", "sigma0", "gamma0"],
+            }
+
             # dict mapping specifying if the variable has 'pol' dimension
             self._vars_with_pol = {
                 "sigma0_lut": True,
@@ -574,23 +635,40 @@ class Sentinel1Dataset(BaseDataset):
                 "latitude": False,
             }
             if skip_variables is None:
-                skip_variables = []
+                skip_variables = list(self._default_skip_variables)
             # variables not returned to the user (unless luts=True)
             # self._hidden_vars = ['sigma0_lut', 'gamma0_lut', 'noise_lut', 'noise_lut_range', 'noise_lut_azi']
             self._hidden_vars = []
             # attribute to activate correction on variables, if available
             self._patch_variable = patch_variable
             if load_luts:
-                self._luts = self._lazy_load_luts(self._map_lut_files.keys())
+                # a lut is not built if it is skipped, with all the variables computed from it
+                luts_names = [
+                    lut_name
+                    for lut_name in self._map_lut_files.keys()
+                    if not set([lut_name] + self._map_lut_vars[lut_name]).issubset(skip_variables)
+                ]
+                self._luts = self._lazy_load_luts(luts_names, lut_chunks=lut_chunks)
+                self._luts_sq = {}
 
                 # noise_lut is noise_lut_range * noise_lut_azi
                 if (
                     "noise_lut_range" in self._luts.keys()
                     and "noise_lut_azi" in self._luts.keys()
                 ):
-                    self._luts = self._luts.assign(
-                        noise_lut=self._luts.noise_lut_range * self._luts.noise_lut_azi
-                    )
+                    noise_lut_range = self._luts.noise_lut_range
+                    noise_lut_azi = self._luts.noise_lut_azi
+                    if set(noise_lut_range.dims) == set(noise_lut_azi.dims):
+                        # both luts share the dataset coordinates: multiply dask arrays, without xarray alignment
+                        noise_lut = xr.DataArray(
+                            noise_lut_range.data
+                            * noise_lut_azi.transpose(*noise_lut_range.dims).data,
+                            dims=noise_lut_range.dims,
+                            coords=noise_lut_range.coords,
+                        )
+                    else:
+                        noise_lut = noise_lut_range * noise_lut_azi
+                    self._luts = self._luts.assign(noise_lut=noise_lut)
                     self._luts.noise_lut.attrs["history"] = merge_yaml(
                         [
                             self._luts.noise_lut_range.attrs["history"]
@@ -1017,19 +1095,21 @@ class Sentinel1Dataset(BaseDataset):
         --------
 
         """
+        # collect new variables, to assign them in a single pass
+        new_vars = {}
         for var_name, lut_name in self._map_var_lut.items():
             if lut_name in self._luts:
-                # merge var_name into dataset (not denoised)
-                self._dataset = self._dataset.merge(
-                    self._apply_calibration_lut(var_name)
-                )
-                # merge noise equivalent for var_name (named 'ne%sz' % var_name[0)
-                self._dataset = self._dataset.merge(self._get_noise(var_name))
+                # var_name (not denoised)
+                new_vars.update(self._apply_calibration_lut(var_name).data_vars)
+                if "noise_lut" in self._luts:
+                    # noise equivalent for var_name (named 'ne%sz' % var_name[0)
+                    new_vars.update(self._get_noise(var_name).data_vars)
             else:
                 logger.debug(
                     "Skipping variable '%s' ('%s' lut is missing)"
                     % (var_name, lut_name)
                 )
+        self._dataset = self._dataset.assign(new_vars)
 
         if self.apply_recalibration:
             interest_var = ["sigma0_raw", "gamma0_raw", "beta0_raw"]
@@ -1096,13 +1176,12 @@ class Sentinel1Dataset(BaseDataset):
             # check if new ds has changed coordinates
             if not self.sliced:
                 self.sliced = any(
-                    [
-                        list(ds[d].values) != list(self._dataset[d].values)
-                        for d in ["line", "sample"]
-                    ]
+                    not np.array_equal(ds[d].values, self._dataset[d].values)
+                    for d in ["line", "sample"]
                 )
             self._dataset = ds
             # self._dataset = self.datatree['measurement'].ds
+            self._cache_bbox = None
             self.recompute_attrs()
         else:
             raise ValueError("dataset must be same kind as original one.")
@@ -1155,13 +1234,16 @@ class Sentinel1Dataset(BaseDataset):
         return lut
 
     @timing
-    def _lazy_load_luts(self, luts_names):
+    def _lazy_load_luts(self, luts_names, lut_chunks=None):
         """
         lazy load luts from xml files
         Parameters
         ----------
         luts_names: list of str
 
+        lut_chunks: dict, optional
+            dask chunks for luts evaluation. If None, use `self._da_tmpl` chunks.
+
 
         Returns
         -------
@@ -1285,10 +1367,11 @@ class Sentinel1Dataset(BaseDataset):
 
             return _NoiseLut(blocks)
 
-        def noise_lut_azi():
+        def noise_lut_azi(pol):
             """
             Parameters
             ----------
+            pol: str
             line_azi
             line_azi_start
             line_azi_stop
@@ -1385,11 +1468,12 @@ class Sentinel1Dataset(BaseDataset):
             return lut_f
 
         # get the lut in metadata. Lut name must be in self._map_lut_files.keys()
+        # (functions, so metadata of luts not in `luts_names` are not read)
         _get_lut_meta = {
-            "sigma0_lut": self.sar_meta.get_calibration_luts.sigma0_lut,
-            "gamma0_lut": self.sar_meta.get_calibration_luts.gamma0_lut,
-            "noise_lut_range": self.sar_meta.get_noise_range_raw,
-            "noise_lut_azi": self.sar_meta.get_noise_azi_raw,
+            "sigma0_lut": lambda: self.sar_meta.get_calibration_luts.sigma0_lut,
+            "gamma0_lut": lambda: self.sar_meta.get_calibration_luts.gamma0_lut,
+            "noise_lut_range": lambda: self.sar_meta.get_noise_range_raw,
+            "noise_lut_azi": lambda: self.sar_meta.get_noise_azi_raw,
         }
         # map the func to apply for each lut. Lut name must be in self._map_lut_files.keys()
         _map_func = {
@@ -1398,10 +1482,13 @@ class Sentinel1Dataset(BaseDataset):
             "noise_lut_range": noise_lut_range,
             "noise_lut_azi": noise_lut_azi,
         }
+        da_tmpl = self._da_tmpl
+        if lut_chunks is not None:
+            da_tmpl = da_tmpl.chunk(lut_chunks)
         luts_list = []
-        luts = None
+        luts = xr.Dataset()
         for lut_name in luts_names:
-            raw_lut = _get_lut_meta[lut_name]
+            raw_lut = _get_lut_meta[lut_name]()
             for pol in raw_lut.pol.values:
                 if self._vars_with_pol[lut_name]:
                     name = "%s_%s" % (lut_name, pol)
@@ -1410,17 +1497,22 @@ class Sentinel1Dataset(BaseDataset):
 
                 # get the lut function. As it takes some time to parse xml, make it delayed
                 if lut_name == "noise_lut_azi":
-                    # noise_lut_azi doesn't need the raw_lut
-                    lut_f_delayed = dask.delayed(_map_func[lut_name])()
+                    # noise_lut_azi doesn't need the raw_lut.
+                    # pol is passed explicitly, because the delayed call is evaluated after the loop
+                    lut_f_delayed = dask.delayed(_map_func[lut_name])(pol)
                 else:
                     lut_f_delayed = dask.delayed(_map_func[lut_name])(
                         raw_lut.sel(pol=pol)
                     )
                 lut = map_blocks_coords(
-                    self._da_tmpl.astype(self._dtypes[lut_name]),
+                    da_tmpl,
                     lut_f_delayed,
+                    dtype=self._dtypes[lut_name],
                     name="blocks_%s" % name,
                 )
+                if lut_chunks is not None:
+                    # back to dataset chunks (splitting blocks is cheap)
+                    lut = lut.chunk(self._da_tmpl.chunksizes)
                 # needs to add pol dim ?
                 if self._vars_with_pol[lut_name]:
                     lut = lut.assign_coords(pol=pol).expand_dims("pol")
@@ -1434,13 +1526,15 @@ class Sentinel1Dataset(BaseDataset):
                 lut = lut.to_dataset()
 
                 luts_list.append(lut)
+        if luts_names:
+            # combine once, after all luts are lazily defined
             luts = xr.combine_by_coords(luts_list)
         return luts
 
     @timing
     def _load_from_geoloc(self, varnames, lazy_loading=True):
         """
-        Interpolate (with RectBiVariateSpline) variables from `self.sar_meta.geoloc` to `self._dataset`
+        Interpolate (bilinear, with `xsar.utils.BilinearInterpolator`) variables from `self.sar_meta.geoloc` to `self._dataset`
 
         Parameters
         ----------
@@ -1473,7 +1567,7 @@ class Sentinel1Dataset(BaseDataset):
 
             def wrapperfunc(*args, **kwargs):
                 rbs2 = args[2]
-                return rbs2(args[0], args[1], grid=False)
+                return rbs2.ev(args[0], args[1])
 
             return wrapperfunc(
                 vect1dazti[:, np.newaxis], vect1dxtrac[np.newaxis, :], rbs
@@ -1493,36 +1587,32 @@ class Sentinel1Dataset(BaseDataset):
                 z_values = self.sar_meta.geoloc[varname_in_geoloc]
             if self.sar_meta._bursts["burst"].size != 0:
                 # TOPS SLC
-                rbs = RectBivariateSpline(
+                rbs = BilinearInterpolator(
                     self.sar_meta.geoloc.azimuthTime[:, 0].astype(float),
                     self.sar_meta.geoloc.sample,
                     z_values,
-                    kx=1,
-                    ky=1,
                 )
                 interp_func = interp_func_slc
             else:
                 rbs = None
-                interp_func = RectBivariateSpline(
+                interp_func = BilinearInterpolator(
                     self.sar_meta.geoloc.line,
                     self.sar_meta.geoloc.sample,
                     z_values,
-                    kx=1,
-                    ky=1,
                 )
             # the following take much cpu and memory, so we want to use dask
             # interp_func(self._dataset.line, self.dataset.sample)
             typee = self.sar_meta.geoloc[varname_in_geoloc].dtype
 
             if self.sar_meta._bursts["burst"].size != 0:
-                datemplate = self._da_tmpl.astype(typee).copy()
+                datemplate = self._da_tmpl.copy()
                 # replace the line coordinates by line_time coordinates
                 datemplate = datemplate.assign_coords(
                     {"line": datemplate.coords["line_time"]}
                 )
                 if lazy_loading:
                     da_var = map_blocks_coords(
-                        datemplate, interp_func, func_kwargs={"rbs": rbs}
+                        datemplate, interp_func, func_kwargs={"rbs": rbs}, dtype=typee
                     )
                     # put back the real line coordinates
                     da_var = da_var.assign_coords(
@@ -1534,19 +1624,16 @@ class Sentinel1Dataset(BaseDataset):
                         line_time.astype(
                             float), self._dataset.digital_number.sample
                     )
-                    da_var = rbs(XX, YY, grid=False)
+                    da_var = rbs.ev(XX, YY)
                     da_var = xr.DataArray(
                         da_var.T,
-                        coords={
-                            "line": self._dataset.digital_number.line,
-                            "sample": self._dataset.digital_number.sample,
-                        },
+                        coords=self._dn_coords(),
                         dims=["line", "sample"],
                     )
             else:
                 if lazy_loading:
                     da_var = map_blocks_coords(
-                        self._da_tmpl.astype(typee), interp_func)
+                        self._da_tmpl, interp_func, dtype=typee)
                 else:
                     da_var = interp_func(
                         self._dataset.digital_number.line,
@@ -1554,7 +1641,9 @@ class Sentinel1Dataset(BaseDataset):
                     )
             if varname == "longitude":
                 if self.sar_meta.cross_antimeridian:
-                    da_var.data = da_var.data.map_blocks(to_lon180)
+                    da_var.data = da_var.data.map_blocks(
+                        to_lon180, meta=np.empty((0, 0), da_var.dtype)
+                    )
 
             da_var.name = varname
 
@@ -1608,6 +1697,28 @@ class Sentinel1Dataset(BaseDataset):
         )
         return z_interp_value
 
+    def _get_lut_sq(self, var_name):
+        """
+        Get squared lut for `var_name`.
+        It's computed once, and shared by calibration, noise and reverse calibration.
+
+        Parameters
+        ----------
+        var_name: str
+
+        Returns
+        -------
+        xarray.DataArray
+            `lut ** 2` for `var_name`
+        """
+        lut_name = self._map_var_lut.get(var_name)
+        if self._luts_sq is None:
+            self._luts_sq = {}
+        if lut_name not in self._luts_sq:
+            lut = self._get_lut(var_name)
+            self._luts_sq[lut_name] = lut * lut
+        return self._luts_sq[lut_name]
+
     def _apply_calibration_lut(self, var_name):
         """
         Apply calibration lut to `digital_number` to compute `var_name`.
@@ -1624,7 +1735,16 @@ class Sentinel1Dataset(BaseDataset):
             with one variable named by `var_name`
         """
         lut = self._get_lut(var_name)
-        res = np.abs(self._dataset.digital_number) ** 2.0 / (lut**2)
+        lut_sq = self._get_lut_sq(var_name)
+        dn = self._dataset.digital_number
+        res = xr.apply_ufunc(
+            _calibrate_block,
+            dn,
+            lut_sq,
+            dask="parallelized",
+            join="inner",
+            dask_gufunc_kwargs={"meta": _block_meta(_calibrate_block, dn, lut_sq)},
+        )
         astype = self._dtypes.get(var_name)
         if astype is not None:
             res = res.astype(astype)
@@ -1675,19 +1795,22 @@ class Sentinel1Dataset(BaseDataset):
 
         # Retrieve the variable data array and corresponding LUT
         da_var = self._dataset[var_name]
-        lut = self._luts[self._map_var_lut[var_name]]
+        lut_sq = self._get_lut_sq(var_name)
 
         # Interpolate the LUT to match the variable's coordinates
-        lut = lut.interp(line=da_var.line, sample=da_var.sample)
-
-        # Reverse the LUT application to compute the squared digital number
-        dn2 = da_var * (lut**2)
-
-        # Where the variable data array is NaN, set the squared digital number to 0
-        dn2 = xr.where(np.isnan(da_var), 0, dn2)
-
-        # Apply square root to get the digital number
-        dn = np.sqrt(dn2)
+        lut_sq = lut_sq.interp(line=da_var.line, sample=da_var.sample)
+
+        # Reverse the LUT application: square root of the squared digital number,
+        # set to 0 where the variable data array is NaN
+        dn = xr.apply_ufunc(
+            _uncalibrate_block,
+            da_var,
+            lut_sq,
+            dask="parallelized",
+            join="inner",
+            keep_attrs=False,
+            dask_gufunc_kwargs={"meta": _block_meta(_uncalibrate_block, da_var, lut_sq)},
+        )
 
         # Check and warn if the dtype of the original 'digital_number' is not preserved
         if (
@@ -1721,7 +1844,7 @@ class Sentinel1Dataset(BaseDataset):
         """
         noise_lut = self._luts["noise_lut"]
         lut = self._get_lut(var_name)
-        dataarr = noise_lut / lut**2
+        dataarr = noise_lut / self._get_lut_sq(var_name)
         name = "ne%sz" % var_name[0]
         astype = self._dtypes.get(name)
         if astype is not None:
@@ -1731,6 +1854,39 @@ class Sentinel1Dataset(BaseDataset):
         )
         return dataarr.to_dataset(name=name)
 
+    @staticmethod
+    def _denoise(raw, noise, clip=False):
+        """
+        Subtract `noise` from `raw`, and clip negative values to 0 if `clip`, in a single pass.
+
+        Parameters
+        ----------
+        raw: xarray.DataArray
+            non denoised variable
+        noise: xarray.DataArray
+            noise equivalent variable
+        clip: bool, optional
+            If True, negative signal will be clipped to 0. (default to False )
+
+        Returns
+        -------
+        xarray.DataArray
+        """
+        return xr.apply_ufunc(
+            _denoise_block,
+            raw,
+            noise,
+            kwargs={"clip": clip},
+            dask="parallelized",
+            join="inner",
+            dask_gufunc_kwargs={
+                "meta": np.empty(
+                    (0,) * max(raw.ndim, noise.ndim),
+                    np.result_type(raw.dtype, noise.dtype),
+                )
+            },
+        )
+
     def _add_denoised(self, ds, clip=False, vars=None):
         """add denoised vars to dataset
 
@@ -1750,6 +1906,8 @@ class Sentinel1Dataset(BaseDataset):
         """
         if vars is None:
             vars = ["sigma0", "beta0", "gamma0"]
+        # lazy denoised vars, assigned in a single pass
+        denoised_vars = {}
         for varname in vars:
             varname_raw = varname + "_raw"
             noise = "ne%sz" % varname[0]
@@ -1757,18 +1915,23 @@ class Sentinel1Dataset(BaseDataset):
                 continue
             if all(self.sar_meta.denoised.values()):
                 # already denoised, just add an alias
-                ds[varname] = ds[varname_raw]
+                denoised_vars[varname] = ds[varname_raw]
             elif len(set(self.sar_meta.denoised.values())) != 1:
                 # TODO: to be implemented
                 raise NotImplementedError(
                     "semi denoised products not yet implemented")
+            elif noise not in ds:
+                # noise luts skipped
+                continue
             else:
                 varname_raw_corrected = varname_raw + "__corrected"
                 if (self.apply_recalibration) & (
                     varname_raw_corrected in self._dataset_recalibration.variables
                 ):
-                    denoised = (
-                        self._dataset_recalibration[varname_raw_corrected] - ds[noise]
+                    denoised = self._denoise(
+                        self._dataset_recalibration[varname_raw_corrected],
+                        ds[noise],
+                        clip=clip,
                     )
                     denoised.attrs["history"] = merge_yaml(
                         [ds[varname_raw].attrs["history"],
@@ -1779,7 +1942,7 @@ class Sentinel1Dataset(BaseDataset):
                         "kersten recalibration applied"
                     )
                 else:
-                    denoised = ds[varname_raw] - ds[noise]
+                    denoised = self._denoise(ds[varname_raw], ds[noise], clip=clip)
                     denoised.attrs["history"] = merge_yaml(
                         [ds[varname_raw].attrs["history"],
                             ds[noise].attrs["history"]],
@@ -1790,12 +1953,11 @@ class Sentinel1Dataset(BaseDataset):
                     )
 
                 if clip:
-                    denoised = denoised.clip(min=0)
                     denoised.attrs["comment"] = "clipped, no values <0"
                 else:
                     denoised.attrs["comment"] = "not clipped, some values can be <0"
-                ds[varname] = denoised
-        return ds
+                denoised_vars[varname] = denoised
+        return ds.assign(denoised_vars)
 
     @property
     def get_burst_azitime(self):
@@ -1834,8 +1996,7 @@ class Sentinel1Dataset(BaseDataset):
             ]
         )
         vels = np.sqrt(np.sum(velos, axis=0))
-        interp_f = interp1d(azi_times.astype(float), vels)
-        _vels = interp_f(azimuth_times.astype(float))
+        _vels = np.interp(azimuth_times.astype(float), azi_times.astype(float), vels)
         res = xr.DataArray(_vels, dims=["line"], coords={
                            "line": self.dataset.line})
         return xr.Dataset({"velocity": res})
@@ -1920,8 +2081,7 @@ class Sentinel1Dataset(BaseDataset):
             n_pixels = int((len(self.sar_meta.geoloc["sample"]) - 1) / 2)
             geoloc_azitime = self.sar_meta.geoloc["azimuthTime"].values[:, n_pixels]
             geoloc_line = self.sar_meta.geoloc["line"].values
-            finterp = interp1d(geoloc_line, geoloc_azitime.astype(float))
-            azitime = finterp(line)
+            azitime = np.interp(line, geoloc_line, geoloc_azitime.astype(float))
             azitime = azitime.astype("<M8[ns]")
         azitime = xr.DataArray(
             azitime,
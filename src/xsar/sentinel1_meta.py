@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import logging
+from functools import cached_property
 import numpy as np
 import xarray
 import pandas as pd
@@ -11,7 +12,7 @@ from shapely.geometry import Polygon
 from shapely.ops import unary_union
 
 from .base_meta import BaseMeta
-from .utils import haversine, timing
+from .utils import BilinearInterpolator, haversine, timing
 import os
 from .ipython_backends import repr_mimebundle
 
@@ -376,10 +377,11 @@ class Sentinel1Meta(BaseMeta):
         """
         return self.dt["azimuth_fmrate"].to_dataset()
 
-    @property
+    @cached_property
     def _dict_coords2ll(self):
         """
-        dict with keys ['longitude', 'latitude'] with interpolation function (RectBivariateSpline) as values.
+        dict with keys ['longitude', 'latitude'] with interpolation function (`xsar.utils.BilinearInterpolator`) as values.
+        Interpolators are built on first access, and cached for the lifetime of the instance.
 
         Examples:
         ---------
@@ -394,16 +396,15 @@ class Sentinel1Meta(BaseMeta):
         """
         resdict = {}
         geoloc = self.geoloc
-        if self.cross_antimeridian:
-            geoloc["longitude"] = geoloc["longitude"] % 360
-
         idx_sample = np.array(geoloc.sample)
         idx_line = np.array(geoloc.line)
+        grids = {ll: np.asarray(geoloc[ll]) for ll in ["longitude", "latitude"]}
+        if self.cross_antimeridian:
+            # work on a copy, so self.geoloc is left untouched
+            grids["longitude"] = grids["longitude"] % 360
 
-        for ll in ["longitude", "latitude"]:
-            resdict[ll] = RectBivariateSpline(
-                idx_line, idx_sample, np.asarray(geoloc[ll]), kx=1, ky=1
-            )
+        for ll, grid in grids.items():
+            resdict[ll] = BilinearInterpolator(idx_line, idx_sample, grid)
 
         return resdict
 
@@ -2,15 +2,17 @@
 
 import warnings
 import time
+import math
+import bisect
 import os
 
 import numpy as np
 import logging
-from scipy.interpolate import griddata
+from scipy.interpolate import griddata, RectBivariateSpline
 import xarray as xr
 import dask
 from dask.distributed import get_client
-from functools import wraps, partial
+from functools import wraps, partial, cached_property
 import rasterio
 import shutil
 import glob
@@ -135,6 +137,25 @@ def to_lon180(lon):
     return lon
 
 
+_EARTH_RADIUS = 6371000  # Radius of earth in meters.
+
+
+def _haversine_scalar(lon1, lat1, lon2, lat2):
+    """`haversine` for python floats, using the `math` module"""
+    lon1, lat1, lon2, lat2 = map(math.radians, (lon1, lat1, lon2, lat2))
+    dlon = lon2 - lon1
+    dlat = lat2 - lat1
+    cos_lat1 = math.cos(lat1)
+    cos_lat2 = math.cos(lat2)
+    a = math.sin(dlat / 2) ** 2 + cos_lat1 * cos_lat2 * math.sin(dlon / 2) ** 2
+    c = 2 * math.asin(math.sqrt(min(1.0, a)))
+    bearing = math.atan2(
+        math.sin(dlon) * cos_lat2,
+        cos_lat1 * math.sin(lat2) - math.sin(lat1) * cos_lat2 * math.cos(dlon),
+    )
+    return c * _EARTH_RADIUS, math.degrees(bearing)
+
+
 def haversine(lon1, lat1, lon2, lat2):
     """
     Compute distance in meters, and bearing in degrees from point1 to point2, assuming spherical earth.
@@ -152,22 +173,25 @@ def haversine(lon1, lat1, lon2, lat2):
         distance in meters, and bearing in degrees
 
     """
+    if all(np.ndim(v) == 0 for v in (lon1, lat1, lon2, lat2)):
+        # scalar fast path: python math is much faster than numpy ufuncs on scalars
+        return _haversine_scalar(float(lon1), float(lat1), float(lon2), float(lat2))
+
     # convert decimal degrees to radians
     lon1, lat1, lon2, lat2 = map(np.radians, [lon1, lat1, lon2, lat2])
 
     # haversine formula
     dlon = lon2 - lon1
     dlat = lat2 - lat1
-    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * \
-        np.cos(lat2) * np.sin(dlon / 2) ** 2
+    cos_lat1 = np.cos(lat1)
+    cos_lat2 = np.cos(lat2)
+    a = np.sin(dlat / 2) ** 2 + cos_lat1 * cos_lat2 * np.sin(dlon / 2) ** 2
     c = 2 * np.arcsin(np.sqrt(a))
-    r = 6371000  # Radius of earth in meters.
     bearing = np.arctan2(
-        np.sin(lon2 - lon1) * np.cos(lat2),
-        np.cos(lat1) * np.sin(lat2) - np.sin(lat1) *
-        np.cos(lat2) * np.cos(lon2 - lon1),
+        np.sin(dlon) * cos_lat2,
+        cos_lat1 * np.sin(lat2) - np.sin(lat1) * cos_lat2 * np.cos(dlon),
     )
-    return c * r, np.rad2deg(bearing)
+    return c * _EARTH_RADIUS, np.rad2deg(bearing)
 
 
 def minigrid(x, y, z, method="linear", dims=["x", "y"]):
@@ -202,7 +226,116 @@ def minigrid(x, y, z, method="linear", dims=["x", "y"]):
     return xr.DataArray(ngrid, dims=dims, coords={dims[0]: x_u, dims[1]: y_u})
 
 
-def map_blocks_coords(da, func, func_kwargs={}, **kwargs):
+_SCALAR_TYPES = (int, float, np.number)
+
+
+class BilinearInterpolator:
+    """
+    Bilinear interpolation on a rectilinear grid.
+
+    Same behaviour as `scipy.interpolate.RectBivariateSpline(x, y, z, kx=1, ky=1)`:
+    `ev` evaluates at points, and calling the instance evaluates on the grid defined by two 1D arrays.
+    Points outside the grid are clamped to the grid edges.
+
+    Scalar points and grids are computed without the FITPACK overhead,
+    while scattered points arrays are still evaluated by `RectBivariateSpline.ev`, that is faster for them.
+
+    Parameters
+    ----------
+    x: 1D array_like
+        increasing coordinates along the first axis of `z`
+    y: 1D array_like
+        increasing coordinates along the second axis of `z`
+    z: 2D array_like
+        values, with shape (x.size, y.size)
+    """
+
+    # max grid size along y for the matrix product path in `__call__`
+    _matmul_max_size = 64
+
+    def __init__(self, x, y, z):
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        for name, coords in [("x", self.x), ("y", self.y)]:
+            if coords.ndim != 1 or coords.size < 2 or np.any(np.diff(coords) <= 0):
+                raise ValueError("%s must be strictly increasing" % name)
+        self.z = np.ascontiguousarray(z, dtype=float)
+        # nan are propagated along whole rows by the matrix product in `__call__`
+        self._finite = bool(np.isfinite(self.z).all())
+        # python lists, for the scalar path
+        self._x_list = self.x.tolist()
+        self._y_list = self.y.tolist()
+
+    @staticmethod
+    def _bracket_scalar(coords, value):
+        # like `_bracket`, for a python float
+        if value != value:
+            # nan: nan fractional distance, so the result is nan, like the array path
+            return 0, value
+        if value <= coords[0]:
+            return 0, 0.0
+        if value >= coords[-1]:
+            return len(coords) - 2, 1.0
+        idx = bisect.bisect_right(coords, value) - 1
+        return idx, (value - coords[idx]) / (coords[idx + 1] - coords[idx])
+
+    @staticmethod
+    def _bracket(coords, values):
+        # index of the lower grid node, and fractional distance to the upper one
+        values = np.clip(values, coords[0], coords[-1])
+        idx = np.clip(np.searchsorted(coords, values, side="right") - 1, 0, coords.size - 2)
+        frac = (values - coords[idx]) / (coords[idx + 1] - coords[idx])
+        return idx, frac
+
+    @cached_property
+    def _spline(self):
+        # for scattered points arrays, built on first use
+        return RectBivariateSpline(self.x, self.y, self.z, kx=1, ky=1)
+
+    def ev(self, x, y):
+        """
+        Evaluate at points `(x[i], y[i])`.
+
+        Returns
+        -------
+        np.ndarray or np.float64
+            same shape as broadcasted `x` and `y` (np.float64 if both are scalars)
+        """
+        if isinstance(x, _SCALAR_TYPES) and isinstance(y, _SCALAR_TYPES):
+            i, tx = self._bracket_scalar(self._x_list, float(x))
+            j, ty = self._bracket_scalar(self._y_list, float(y))
+            z = self.z
+            return np.float64(
+                (1 - tx) * ((1 - ty) * z.item(i, j) + ty * z.item(i, j + 1))
+                + tx * ((1 - ty) * z.item(i + 1, j) + ty * z.item(i + 1, j + 1))
+            )
+        return self._spline.ev(x, y)
+
+    def __call__(self, x, y):
+        """
+        Evaluate on the grid defined by 1D arrays `x` and `y`.
+
+        Returns
+        -------
+        np.ndarray
+            shape (x.size, y.size)
+        """
+        i, tx = self._bracket(self.x, np.asarray(x, dtype=float).ravel())
+        j, ty = self._bracket(self.y, np.asarray(y, dtype=float).ravel())
+        z = self.z
+        # interpolation is separable: first along x, only on the (few) grid columns
+        rows = (1 - tx)[:, np.newaxis] * z[i] + tx[:, np.newaxis] * z[i + 1]
+        if self._finite and self.y.size <= self._matmul_max_size:
+            # then along y, as a product with the sparse weights matrix (BLAS is fast and multithreaded)
+            weights = np.zeros((self.y.size, ty.size))
+            k = np.arange(ty.size)
+            weights[j, k] = 1 - ty
+            weights[j + 1, k] += ty
+            return rows @ weights
+        return rows[:, j] * (1 - ty) + rows[:, j + 1] * ty
+
+
+def map_blocks_coords(da, func, func_kwargs={}, dtype=None, **kwargs):
     """
     like `dask.map_blocks`, but `func` parameters are dimensions coordinates belonging to the block.
 
@@ -213,6 +346,9 @@ def map_blocks_coords(da, func, func_kwargs={}, **kwargs):
     func: function or future
         function that take gridded `numpy.array` atrack and xtrack, and return a `numpy.array`.
         (see `_evaluate_from_coords`)
+    dtype: numpy.dtype, optional
+        output dtype. If None, use `da` dtype.
+        Giving it avoids an extra `da.astype(dtype)` layer in the dask graph, as `da` values are not used.
     kwargs: dict
         passed to dask.array.map_blocks
 
@@ -270,17 +406,24 @@ def map_blocks_coords(da, func, func_kwargs={}, **kwargs):
         return result
 
     coords = {c: da[c].values for c in da.dims}
+    # output coordinates, sharing `da` variables and indexes by reference
+    out_coords = xr.Coordinates(
+        {c: da.coords[c].variable for c in da.dims},
+        indexes={c: da.xindexes[c] for c in da.dims if c in da.xindexes},
+    )
     if "name" not in kwargs:
         kwargs["name"] = dask.utils.funcname(func)
 
-    meta = da.data
-    dtype = meta.dtype
+    if dtype is None:
+        dtype = da.dtype
+    dtype = np.dtype(dtype)
+    meta = np.empty((0,) * da.ndim, dtype=dtype)
 
     from_coords = bind(_evaluate_from_coords, ..., ...,
                        coords.values(), dtype=dtype)
 
-    daskarr = meta.map_blocks(from_coords, func, meta=meta, **kwargs)
-    dataarr = xr.DataArray(daskarr, dims=da.dims, coords=coords)
+    daskarr = da.data.map_blocks(from_coords, func, meta=meta, **kwargs)
+    dataarr = xr.DataArray(daskarr, dims=da.dims, coords=out_coords)
     return dataarr
 
 
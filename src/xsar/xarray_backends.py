@@ -1,36 +1,55 @@
 import xarray as xr
-import xsar
-import rasterio
 import warnings
 import os
+import sys
 
 
 class XsarXarrayBackend(xr.backends.common.BackendEntrypoint):
+    # xsar (and its heavy dependencies) is only imported when a dataset is really opened,
+    # not when xarray loads the backends entry points
     def open_dataset(
         self,
         dataset_id,
         resolution=None,
-        resampling=rasterio.enums.Resampling.rms,
+        resampling=None,
         luts=False,
         dtypes=None,
-        drop_variables=[],
+        drop_variables=None,
     ):
+        import xsar
+
+        if drop_variables is None:
+            drop_variables = []
+        elif isinstance(drop_variables, str):
+            drop_variables = [drop_variables]
+        kwargs = {}
+        if resampling is not None:
+            kwargs["resampling"] = resampling
+        if drop_variables:
+            # don't compute dropped variables at all, if the reader can skip them.
+            # (added to the reader default skip list, not replacing it)
+            default_skip = xsar.xsar._dataset_class(dataset_id)._default_skip_variables
+            kwargs["skip_variables"] = list(default_skip) + [
+                v for v in drop_variables if v not in default_skip
+            ]
         ds = xsar.open_dataset(
             dataset_id,
             resolution=resolution,
-            resampling=resampling,
             luts=luts,
             dtypes=dtypes,
+            **kwargs,
         )
-        if not list(ds.chunks):
+        # stop at the first chunked variable (`ds.chunks` would build the whole chunks mapping)
+        if not any(v.chunks is not None for v in ds.variables.values()):
             warnings.warn("Not using `chunks` kw is discouraged when openning SAFE")
         return ds.drop_vars(drop_variables, errors="ignore")
 
     def guess_can_open(self, filename_or_obj):
-        if isinstance(filename_or_obj, xsar.Sentinel1Meta):
-            return True
-        if isinstance(filename_or_obj, str) and os.path.basename(
-            filename_or_obj
-        ).endswith(".SAFE"):
-            return True
-        return False
+        if isinstance(filename_or_obj, str):
+            # common case first: a filename, without importing xsar
+            return os.path.basename(filename_or_obj).endswith(".SAFE")
+        # if `Sentinel1Meta` is not imported yet, `filename_or_obj` can't be an instance of it
+        sentinel1_meta = sys.modules.get("xsar.sentinel1_meta")
+        if sentinel1_meta is None:
+            return False
+        return isinstance(filename_or_obj, sentinel1_meta.Sentinel1Meta)
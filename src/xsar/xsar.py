@@ -29,6 +29,33 @@ logger.addHandler(logging.NullHandler())
 os.environ["GDAL_CACHEMAX"] = "128"
 
 
+def _dataset_class(dataset_id):
+    """
+    Dataset class (`xsar.Sentinel1Dataset`, `xsar.RadarSat2Dataset` or `xsar.RcmDataset`) that can read `dataset_id`.
+    """
+    # TODO: check product type (S1, RS2), and call specific reader
+    if (
+        isinstance(dataset_id, Sentinel1Meta)
+        or isinstance(dataset_id, str)
+        and "S1" in dataset_id
+    ):
+        return Sentinel1Dataset
+    elif (
+        isinstance(dataset_id, RadarSat2Meta)
+        or isinstance(dataset_id, str)
+        and "RS2" in dataset_id
+    ):
+        return RadarSat2Dataset
+    elif (
+        isinstance(dataset_id, RcmMeta)
+        or isinstance(dataset_id, str)
+        and "RCM" in dataset_id
+    ):
+        return RcmDataset
+    else:
+        raise TypeError("Unknown dataset type from %s" % str(dataset_id))
+
+
 @timing
 def open_dataset(*args, **kwargs):
     """
@@ -57,28 +84,7 @@ def open_dataset(*args, **kwargs):
     xsar.RadarSat2Dataset
     xsar.RcmDataset
     """
-    dataset_id = args[0]
-    # TODO: check product type (S1, RS2), and call specific reader
-    if (
-        isinstance(dataset_id, Sentinel1Meta)
-        or isinstance(dataset_id, str)
-        and "S1" in dataset_id
-    ):
-        sar_obj = Sentinel1Dataset(*args, **kwargs)
-    elif (
-        isinstance(dataset_id, RadarSat2Meta)
-        or isinstance(dataset_id, str)
-        and "RS2" in dataset_id
-    ):
-        sar_obj = RadarSat2Dataset(*args, **kwargs)
-    elif (
-        isinstance(dataset_id, RcmMeta)
-        or isinstance(dataset_id, str)
-        and "RCM" in dataset_id
-    ):
-        sar_obj = RcmDataset(*args, **kwargs)
-    else:
-        raise TypeError("Unknown dataset type from %s" % str(dataset_id))
+    sar_obj = _dataset_class(args[0])(*args, **kwargs)
     ds = sar_obj.dataset
     return ds
 
@@ -110,28 +116,7 @@ def open_datatree(*args, **kwargs):
     xsar.RadarSat2Dataset
     xsar.RcmDataset
     """
-    dataset_id = args[0]
-    # Check product type (S1, RS2), and call specific reader
-    if (
-        isinstance(dataset_id, Sentinel1Meta)
-        or isinstance(dataset_id, str)
-        and "S1" in dataset_id
-    ):
-        sar_obj = Sentinel1Dataset(*args, **kwargs)
-    elif (
-        isinstance(dataset_id, RadarSat2Meta)
-        or isinstance(dataset_id, str)
-        and "RS2" in dataset_id
-    ):
-        sar_obj = RadarSat2Dataset(*args, **kwargs)
-    elif (
-        isinstance(dataset_id, RcmMeta)
-        or isinstance(dataset_id, str)
-        and "RCM" in dataset_id
-    ):
-        sar_obj = RcmDataset(*args, **kwargs)
-    else:
-        raise TypeError("Unknown dataset type from %s" % str(dataset_id))
+    sar_obj = _dataset_class(args[0])(*args, **kwargs)
     dt = sar_obj.datatree
     return dt
 
@@ -39,3 +39,11 @@ def test_cross_antimeridian_from_geoloc(longitudes, expected):
     meta = DummyMeta()
     meta.geoloc = xr.Dataset({"longitude": (("x",), np.array(longitudes))})
     assert meta.cross_antimeridian is expected
+
+
+def test_cross_antimeridian_ignores_nan():
+    meta = DummyMeta()
+    meta.geoloc = xr.Dataset(
+        {"longitude": (("line", "sample"), np.array([[170, -175], [np.nan, 179]]))}
+    )
+    assert meta.cross_antimeridian is True
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+from scipy.interpolate import RectBivariateSpline
+
+from xsar.utils import BilinearInterpolator
+
+
+@pytest.fixture
+def grid():
+    rng = np.random.default_rng(42)
+    lines = np.array([0.0, 120.0, 250.0, 370.0, 499.0])
+    samples = np.array([0.0, 80.0, 160.0, 240.0, 320.0, 399.0])
+    values = rng.uniform(-180, 180, size=(lines.size, samples.size))
+    return lines, samples, values
+
+
+def test_ev_matches_rectbivariatespline(grid):
+    lines, samples, values = grid
+    rbs = RectBivariateSpline(lines, samples, values, kx=1, ky=1)
+    bil = BilinearInterpolator(lines, samples, values)
+
+    # include points outside the grid, that are clamped to the edges
+    x = np.linspace(-50, 550, 101)
+    y = np.linspace(-30, 430, 101)
+    np.testing.assert_allclose(bil.ev(x, y), rbs.ev(x, y))
+
+    # scalar input gives a 0-d result, like RectBivariateSpline.ev
+    scalar = bil.ev(100.5, 200.5)
+    assert scalar.shape == ()
+    np.testing.assert_allclose(scalar, rbs.ev(100.5, 200.5))
+
+
+def test_grid_matches_rectbivariatespline(grid):
+    lines, samples, values = grid
+    rbs = RectBivariateSpline(lines, samples, values, kx=1, ky=1)
+    bil = BilinearInterpolator(lines, samples, values)
+
+    x = np.arange(0, 500, 7)
+    y = np.arange(0, 400, 11)
+    res = bil(x, y)
+    assert res.shape == (x.size, y.size)
+    np.testing.assert_allclose(res, rbs(x, y))
+
+
+def test_grid_large_matches_rectbivariatespline():
+    # more grid columns than `_matmul_max_size`: gather path
+    rng = np.random.default_rng(0)
+    lines = np.arange(10) * 100.0
+    samples = np.arange(BilinearInterpolator._matmul_max_size + 10) * 50.0
+    values = rng.normal(size=(lines.size, samples.size))
+    rbs = RectBivariateSpline(lines, samples, values, kx=1, ky=1)
+    bil = BilinearInterpolator(lines, samples, values)
+
+    x = np.linspace(-10, 1000, 37)
+    y = np.linspace(-10, 4000, 53)
+    np.testing.assert_allclose(bil(x, y), rbs(x, y))
+
+
+def test_ev_nan(grid):
+    lines, samples, values = grid
+    bil = BilinearInterpolator(lines, samples, values)
+
+    # nan scalars give nan, like the array path and RectBivariateSpline.ev
+    assert np.isnan(bil.ev(np.nan, 10.0))
+    assert np.isnan(bil.ev(10.0, np.nan))
+    assert np.isnan(bil.ev(np.array([np.nan]), np.array([10.0]))).all()
+
+
+@pytest.mark.parametrize(
+    "lines",
+    [
+        [499.0, 370.0, 250.0, 120.0, 0.0],
+        [0.0, 250.0, 120.0, 370.0, 499.0],
+        [0.0, 0.0, 250.0, 370.0, 499.0],
+    ],
+)
+def test_not_increasing(grid, lines):
+    _, samples, values = grid
+    with pytest.raises(ValueError):
+        BilinearInterpolator(np.array(lines), samples, values)
+    with pytest.raises(ValueError):
+        BilinearInterpolator(samples, np.array(lines), values.T)
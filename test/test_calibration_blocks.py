@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+import xarray as xr
+
+from xsar.sentinel1_dataset import _block_meta, _uncalibrate_block
+
+
+def _reverse(da_var, lut_sq):
+    # same call as `Sentinel1Dataset.reverse_calibration_lut`
+    return xr.apply_ufunc(
+        _uncalibrate_block,
+        da_var,
+        lut_sq,
+        dask="parallelized",
+        join="inner",
+        keep_attrs=False,
+        dask_gufunc_kwargs={"meta": _block_meta(_uncalibrate_block, da_var, lut_sq)},
+    )
+
+
+@pytest.fixture
+def sigma0():
+    values = np.arange(2 * 4 * 6, dtype=np.float32).reshape(2, 4, 6) / 10
+    values[0, 1, 2] = np.nan
+    values[1, 3, 0] = np.nan
+    return xr.DataArray(
+        values, dims=["pol", "line", "sample"], attrs={"units": "m2/m2"}
+    )
+
+
+@pytest.fixture
+def lut_sq():
+    values = np.linspace(1, 2, 2 * 4 * 6, dtype=np.float32).reshape(2, 4, 6)
+    return xr.DataArray(values, dims=["pol", "line", "sample"])
+
+
+def _expected(da_var, lut_sq):
+    return xr.where(np.isnan(da_var), 0, np.sqrt(da_var * lut_sq))
+
+
+@pytest.mark.parametrize("pol_chunk", [1, 2])
+def test_uncalibrate_pol_chunks(sigma0, lut_sq, pol_chunk):
+    chunks = {"pol": pol_chunk, "line": 2, "sample": 3}
+    dn = _reverse(sigma0.chunk(chunks), lut_sq.chunk(chunks))
+    assert dn.attrs == {}
+    assert dn.dtype == dn.compute().dtype
+    np.testing.assert_allclose(dn.values, _expected(sigma0, lut_sq).values, rtol=1e-6)
+
+
+def test_uncalibrate_broadcast(sigma0, lut_sq):
+    # 2D variable against a 3D lut
+    da_var = sigma0.isel(pol=0, drop=True)
+    expected = _expected(da_var, lut_sq).transpose("pol", "line", "sample")
+
+    dn = _reverse(da_var, lut_sq).transpose("pol", "line", "sample")
+    np.testing.assert_allclose(dn.values, expected.values, rtol=1e-6)
+
+    dn = _reverse(
+        da_var.chunk({"line": 2}), lut_sq.chunk({"pol": 2, "line": 2})
+    ).transpose("pol", "line", "sample")
+    np.testing.assert_allclose(dn.values, expected.values, rtol=1e-6)
+
+    # plain numpy
+    res = _uncalibrate_block(da_var.values, lut_sq.values)
+    np.testing.assert_allclose(res, expected.values, rtol=1e-6)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from xsar.utils import haversine
+
+POINTS = [
+    # lon1, lat1, lon2, lat2
+    (0.0, 0.0, 1.0, 0.0),
+    (-4.5, 48.4, 2.35, 48.85),
+    (179.5, -10.0, -179.5, -10.5),
+    (10.0, 89.0, -170.0, 89.0),
+    (30.0, 20.0, 30.0, 20.0),
+]
+
+
+@pytest.mark.parametrize("point", POINTS)
+def test_haversine_scalar_same_as_array(point):
+    dist, bearing = haversine(*point)
+    assert isinstance(dist, float) and isinstance(bearing, float)
+
+    dist_arr, bearing_arr = haversine(*[np.array([v]) for v in point])
+    assert dist == pytest.approx(dist_arr[0], rel=1e-12, abs=1e-6)
+    assert bearing == pytest.approx(bearing_arr[0], rel=1e-12, abs=1e-9)
+
+
+def test_haversine_numpy_scalars():
+    # numpy scalars also use the scalar path, with the same result
+    dist, bearing = haversine(*[np.float32(v) for v in POINTS[1]])
+    dist_arr, bearing_arr = haversine(*[np.array([v], dtype=np.float32) for v in POINTS[1]])
+    assert dist == pytest.approx(dist_arr[0], rel=1e-6)
+    assert bearing == pytest.approx(bearing_arr[0], rel=1e-6)
+
+
+@pytest.mark.parametrize(
+    "point",
+    [
+        (0.0, 0.0, 180.0, 0.0),
+        (-108.99541897348732, 55.46461532644227, 71.00458102602384, -55.46461532546488),
+        (12.5, -33.3, -167.5, 33.3),
+    ],
+)
+def test_haversine_near_antipodal(point):
+    # rounding can push the haversine term above 1: no error, half the earth circumference
+    dist, _ = haversine(*point)
+    assert dist == pytest.approx(np.pi * 6371000, rel=1e-9)
@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+from affine import Affine
+
+from xsar.base_meta import BaseMeta
+from xsar.utils import BilinearInterpolator
+
+LINES = np.arange(0, 1001, 100.0)
+SAMPLES = np.arange(0, 2001, 200.0)
+
+
+class DummyMeta(BaseMeta):
+    """geolocation grid slightly distorted from `approx_transform`"""
+
+    def __init__(self):
+        super().__init__()
+        lines2d, samples2d = np.meshgrid(LINES, SAMPLES, indexing="ij")
+        self._lon = 10 + 1e-3 * samples2d + 1e-8 * lines2d * samples2d
+        self._lat = 40 + 1e-3 * lines2d + 4e-9 * samples2d**2
+        self.geoloc = xr.Dataset(
+            {"longitude": (("line", "sample"), self._lon)},
+            coords={"line": LINES, "sample": SAMPLES},
+        )
+
+    @property
+    def footprint(self):
+        return None
+
+    @property
+    def _dict_coords2ll(self):
+        return {
+            "longitude": BilinearInterpolator(LINES, SAMPLES, self._lon),
+            "latitude": BilinearInterpolator(LINES, SAMPLES, self._lat),
+        }
+
+    @property
+    def approx_transform(self):
+        # (line, sample) -> (lon, lat), without the distortion
+        return Affine(0, 1e-3, 10, 1e-3, 0, 40)
+
+    @property
+    def _get_time_range(self):
+        return pd.Interval(pd.Timestamp("2000-01-01"), pd.Timestamp("2000-01-02"))
+
+
+@pytest.fixture
+def meta():
+    return DummyMeta()
+
+
+@pytest.fixture
+def points(meta):
+    line = np.array([110.0, 250.0, 500.0, 730.0, 890.0])
+    sample = np.array([220.0, 1500.0, 1000.0, 300.0, 1750.0])
+    lon, lat = meta.coords2ll(line, sample)
+    return line, sample, lon, lat
+
+
+def test_ll2coords_approx(meta, points):
+    _, _, lon, lat = points
+    line, sample = meta.ll2coords(lon, lat, approx=True)
+    expected = ~meta.approx_transform * (lon, lat)
+    np.testing.assert_array_equal(line, expected[0])
+    np.testing.assert_array_equal(sample, expected[1])
+
+
+def test_ll2coords_single_pass(meta, points):
+    # default is the single correction pass
+    _, _, lon, lat = points
+    line_approx, sample_approx = ~meta.approx_transform * (lon, lat)
+    line_identity, sample_identity = ~meta.approx_transform * meta.coords2ll(
+        line_approx, sample_approx
+    )
+    line, sample = meta.ll2coords(lon, lat)
+    np.testing.assert_array_equal(line, 2 * line_approx - line_identity)
+    np.testing.assert_array_equal(sample, 2 * sample_approx - sample_identity)
+
+
+def test_ll2coords_tol(meta, points):
+    line_true, sample_true, lon, lat = points
+    line_single, sample_single = meta.ll2coords(lon, lat)
+    # the single pass is not exact on a distorted grid
+    assert np.max(np.abs(sample_single - sample_true)) > 0.1
+
+    line, sample = meta.ll2coords(lon, lat, tol=1e-3)
+    np.testing.assert_allclose(line, line_true, atol=1e-4)
+    np.testing.assert_allclose(sample, sample_true, atol=1e-4)
+
+    # a large tol stops after the first pass
+    line, sample = meta.ll2coords(lon, lat, tol=1e3)
+    np.testing.assert_array_equal(line, line_single)
+    np.testing.assert_array_equal(sample, sample_single)
+
+
+def test_ll2coords_scalar(meta, points):
+    line_true, sample_true, lon, lat = points
+    line, sample = meta.ll2coords(lon[2], lat[2], tol=1e-3)
+    assert np.ndim(line) == 0 and np.ndim(sample) == 0
+    assert line == pytest.approx(line_true[2], abs=1e-4)
+    assert sample == pytest.approx(sample_true[2], abs=1e-4)
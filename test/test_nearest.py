@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+import xarray as xr
+
+from xsar.base_dataset import BaseDataset, _increasing, _nearest
+
+
+class DummyMeta:
+    """`ll2coords` is the identity: lon, lat are line, sample"""
+
+    def ll2coords(self, lon, lat):
+        return np.asarray(lon, dtype=float), np.asarray(lat, dtype=float)
+
+
+class DummyDataset(BaseDataset):
+    def __init__(self, line, sample):
+        self.sar_meta = DummyMeta()
+        self._dataset = xr.Dataset(coords={"line": line, "sample": sample})
+
+
+@pytest.mark.parametrize(
+    "coords", [np.arange(5, 50, 10.0), np.arange(5, 50, 10.0)[::-1]]
+)
+def test_nearest_same_as_sel(coords):
+    values = np.array([-3.0, 5.0, 9.0, 11.0, 24.9, 44.0, 60.0])
+    expected = xr.DataArray(coords, coords={"x": coords}).sel(x=values, method="nearest")
+    np.testing.assert_array_equal(_nearest(_increasing(coords), values), expected.values)
+
+
+def test_nearest_scalar_and_single_coord():
+    assert _nearest(np.array([5.0, 15.0]), 12.0) == 15.0
+    np.testing.assert_array_equal(_nearest(np.array([5.0]), [1.0, 8.0]), [5.0, 5.0])
+
+
+def test_increasing_not_monotonic():
+    with pytest.raises(ValueError):
+        _increasing(np.array([5.0, 25.0, 15.0, 35.0]))
+    with pytest.raises(ValueError):
+        _increasing(np.array([5.0, 15.0, 15.0, 35.0]))
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_ll2coords_tolerance(reverse):
+    line = np.arange(5, 100, 10.0)
+    sample = np.arange(5, 200, 10.0)
+    if reverse:
+        line = line[::-1]
+    ds = DummyDataset(line, sample)
+    # tolerance is half a step (5) + 1 pixel
+    assert ds.ll2coords(13.0, 51.0) == (15.0, 55.0)
+    line_n, sample_n = ds.ll2coords([13.0, 94.0], [51.0, 0.5])
+    np.testing.assert_array_equal(line_n, [15.0, 95.0])
+    np.testing.assert_array_equal(sample_n, [55.0, 5.0])
+
+    # just inside / outside the tolerance, beyond the last line
+    assert ds.ll2coords(101.0, 51.0) == (95.0, 55.0)
+    assert np.all(np.isnan(ds.ll2coords(101.5, 51.0)))
+    # one point out of bounds invalidates all points
+    line_n, sample_n = ds.ll2coords([13.0, 13.0], [51.0, -2.0])
+    assert np.all(np.isnan(line_n)) and np.all(np.isnan(sample_n))
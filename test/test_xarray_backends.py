@@ -0,0 +1,30 @@
+import xarray as xr
+import xsar
+from xsar.xarray_backends import XsarXarrayBackend
+
+
+def _fake_open_dataset(calls):
+    def open_dataset(dataset_id, **kwargs):
+        calls.append(kwargs)
+        return xr.Dataset({"a": ("x", [1, 2])}).chunk()
+
+    return open_dataset
+
+
+def test_drop_variables_keep_reader_default_skip(monkeypatch):
+    calls = []
+    monkeypatch.setattr(xsar, "open_dataset", _fake_open_dataset(calls))
+
+    XsarXarrayBackend().open_dataset("RCM_product", drop_variables=["land_mask"])
+    # RcmDataset default skip list is kept
+    assert calls[-1]["skip_variables"] == ["velocity", "land_mask"]
+
+    XsarXarrayBackend().open_dataset("RCM_product", drop_variables="velocity")
+    assert calls[-1]["skip_variables"] == ["velocity"]
+
+    XsarXarrayBackend().open_dataset("S1A_product.SAFE", drop_variables=["land_mask"])
+    assert calls[-1]["skip_variables"] == ["land_mask"]
+
+    # nothing dropped: readers use their own default
+    XsarXarrayBackend().open_dataset("RCM_product")
+    assert "skip_variables" not in calls[-1]